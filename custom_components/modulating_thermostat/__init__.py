@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Mapping, cast
+import logging
+from collections.abc import Callable, Mapping
+from typing import Any, cast
 
 import voluptuous as vol
 from homeassistant import config_entries
@@ -50,68 +52,207 @@ from .const import (
 )
 from .coordinator import ModulatingThermostatCoordinator, merge_entry_data
 
+_LOGGER = logging.getLogger(__name__)
 
-def _extract_controllers(value: Any) -> list[dict[str, Any]]:
-    if isinstance(value, dict):
-        controllers_dict = cast(dict[str, Any], value)
-        controllers_raw = controllers_dict.get(CONF_CONTROLLERS)
-        if controllers_raw is None:
-            raise vol.Invalid("missing 'controllers' key")
-        return cast(list[dict[str, Any]], controllers_raw)
-    return cast(list[dict[str, Any]], value)
 
+def _extract_controllers(value: Any) -> Any:
+    """Unwrap ``{controllers: [...]}``; lists are returned untouched."""
+    try:
+        controllers = value.get(CONF_CONTROLLERS)
+    except AttributeError:
+        return value
+    if controllers is None:
+        raise vol.Invalid("missing 'controllers' key")
+    return controllers
 
-ZONE_SCHEMA = vol.Schema(
+
+_REQUIRED: Any = object()
+
+
+def _number(
+    value: Any,
+    coerce: Callable[[Any], Any] = float,
+    minimum: float | None = None,
+    maximum: float | None = None,
+) -> Any:
+    try:
+        number = coerce(value)
+    except (TypeError, ValueError) as err:
+        raise vol.Invalid(f"expected {coerce.__name__}") from err
+    if minimum is not None and number < minimum:
+        raise vol.Invalid(f"value must be at least {minimum}")
+    if maximum is not None and number > maximum:
+        raise vol.Invalid(f"value must be at most {maximum}")
+    return number
+
+
+def _percent(value: Any) -> float:
+    return _number(value, minimum=0, maximum=100)
+
+
+def _deadband(value: Any) -> float:
+    return _number(value, minimum=0.0, maximum=2.0)
+
+
+def _update_interval(value: Any) -> int:
+    return _number(value, int, minimum=10, maximum=600)
+
+
+def _field(
+    data: dict[str, Any],
+    key: str,
+    validator: Callable[[Any], Any],
+    default: Any = _REQUIRED,
+) -> Any:
+    """Validate a single key, attaching the key to any error path."""
+    value = data.get(key, default)
+    if value is _REQUIRED:
+        raise vol.Invalid("required key not provided", path=[key])
+    try:
+        return validator(value)
+    except vol.Invalid as err:
+        err.prepend([key])
+        raise
+
+
+def _as_dict(value: Any, allowed: frozenset[str]) -> dict[str, Any]:
+    if not isinstance(value, dict):
+        raise vol.Invalid("expected a dictionary")
+    data = cast(dict[str, Any], value)
+    for key in data:
+        if key not in allowed:
+            raise vol.Invalid("extra keys not allowed", path=[key])
+    return data
+
+
+_ZONE_KEYS = frozenset(
     {
-        vol.Required(CONF_ZONE_ID): cv.slug,
-        vol.Optional(CONF_ZONE_NAME): cv.string,
-        vol.Optional(CONF_WEIGHT, default=1.0): vol.Coerce(float),
-        vol.Required(CONF_TEMPERATURE_ENTITY): cv.entity_id,
-        vol.Required(CONF_SETPOINT_ENTITY): cv.entity_id,
-        vol.Optional(CONF_ACTUATOR_ENTITY): cv.entity_id,
-        vol.Optional(CONF_ACTUATOR_MIN, default=0.0): vol.Coerce(float),
-        vol.Optional(CONF_ACTUATOR_MAX, default=100.0): vol.Coerce(float),
-        vol.Optional(CONF_DEADBAND, default=DEFAULT_DEADBAND): vol.All(
-            vol.Coerce(float), vol.Range(min=0.0, max=2.0)
-        ),
+        CONF_ZONE_ID,
+        CONF_ZONE_NAME,
+        CONF_WEIGHT,
+        CONF_TEMPERATURE_ENTITY,
+        CONF_SETPOINT_ENTITY,
+        CONF_ACTUATOR_ENTITY,
+        CONF_ACTUATOR_MIN,
+        CONF_ACTUATOR_MAX,
+        CONF_DEADBAND,
     }
 )
 
-CONTROLLER_SCHEMA = vol.Schema(
+_CONTROLLER_KEYS = frozenset(
     {
-        vol.Required(CONF_NAME): cv.string,
-        vol.Required(CONF_OUTDOOR_ENTITY): cv.entity_id,
-        vol.Optional(CONF_FLOW_SENSOR_ENTITY): cv.entity_id,
-        vol.Optional(CONF_AGGRESSIVENESS_ENTITY): cv.entity_id,
-        vol.Optional(CONF_DEFAULT_AGGRESSIVENESS, default=DEFAULT_DEFAULT_AGGRESSIVENESS): vol.All(
-            vol.Coerce(float), vol.Range(min=0, max=100)
+        CONF_NAME,
+        CONF_OUTDOOR_ENTITY,
+        CONF_FLOW_SENSOR_ENTITY,
+        CONF_AGGRESSIVENESS_ENTITY,
+        CONF_DEFAULT_AGGRESSIVENESS,
+        CONF_OUTPUT_MIN,
+        CONF_OUTPUT_MAX,
+        CONF_ACTIVE_MIN_FLOW,
+        CONF_UPDATE_INTERVAL,
+        CONF_WEATHER_REF,
+        CONF_WEATHER_SLOPE_ECO,
+        CONF_WEATHER_SLOPE_BOOST,
+        CONF_WEATHER_OFFSET,
+        CONF_LOG_LEVEL,
+        CONF_ZONES,
+    }
+)
+
+
+def _validate_zone(value: Any) -> dict[str, Any]:
+    """Validate a YAML zone definition in a single straight-line pass."""
+    data = _as_dict(value, _ZONE_KEYS)
+    zone: dict[str, Any] = {
+        CONF_ZONE_ID: _field(data, CONF_ZONE_ID, cv.slug),
+        CONF_WEIGHT: _field(data, CONF_WEIGHT, _number, 1.0),
+        CONF_TEMPERATURE_ENTITY: _field(data, CONF_TEMPERATURE_ENTITY, cv.entity_id),
+        CONF_SETPOINT_ENTITY: _field(data, CONF_SETPOINT_ENTITY, cv.entity_id),
+        CONF_ACTUATOR_MIN: _field(data, CONF_ACTUATOR_MIN, _number, 0.0),
+        CONF_ACTUATOR_MAX: _field(data, CONF_ACTUATOR_MAX, _number, 100.0),
+        CONF_DEADBAND: _field(data, CONF_DEADBAND, _deadband, DEFAULT_DEADBAND),
+    }
+    if CONF_ZONE_NAME in data:
+        zone[CONF_ZONE_NAME] = _field(data, CONF_ZONE_NAME, cv.string)
+    if CONF_ACTUATOR_ENTITY in data:
+        zone[CONF_ACTUATOR_ENTITY] = _field(data, CONF_ACTUATOR_ENTITY, cv.entity_id)
+    return zone
+
+
+def _validate_zones(value: Any) -> list[dict[str, Any]]:
+    zones: list[dict[str, Any]] = []
+    for index, zone in enumerate(cv.ensure_list(value)):
+        try:
+            zones.append(_validate_zone(zone))
+        except vol.Invalid as err:
+            err.prepend([index])
+            raise
+    return zones
+
+
+def _validate_controller(value: Any) -> dict[str, Any]:
+    """Validate a YAML controller definition, returning a plain dict."""
+    data = _as_dict(value, _CONTROLLER_KEYS)
+    controller: dict[str, Any] = {
+        CONF_NAME: _field(data, CONF_NAME, cv.string),
+        CONF_OUTDOOR_ENTITY: _field(data, CONF_OUTDOOR_ENTITY, cv.entity_id),
+        CONF_DEFAULT_AGGRESSIVENESS: _field(
+            data, CONF_DEFAULT_AGGRESSIVENESS, _percent, DEFAULT_DEFAULT_AGGRESSIVENESS
         ),
-        vol.Optional(CONF_OUTPUT_MIN, default=DEFAULT_OUTPUT_MIN): vol.Coerce(float),
-        vol.Optional(CONF_OUTPUT_MAX, default=DEFAULT_OUTPUT_MAX): vol.Coerce(float),
-        vol.Optional(CONF_ACTIVE_MIN_FLOW, default=DEFAULT_ACTIVE_MIN_FLOW): vol.Coerce(float),
-        vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.All(
-            vol.Coerce(int), vol.Range(min=10, max=600)
+        CONF_OUTPUT_MIN: _field(data, CONF_OUTPUT_MIN, _number, DEFAULT_OUTPUT_MIN),
+        CONF_OUTPUT_MAX: _field(data, CONF_OUTPUT_MAX, _number, DEFAULT_OUTPUT_MAX),
+        CONF_ACTIVE_MIN_FLOW: _field(
+            data, CONF_ACTIVE_MIN_FLOW, _number, DEFAULT_ACTIVE_MIN_FLOW
         ),
-        vol.Optional(CONF_WEATHER_REF, default=DEFAULT_WEATHER_REF): vol.Coerce(float),
-        vol.Optional(CONF_WEATHER_SLOPE_ECO, default=DEFAULT_WEATHER_SLOPE_ECO): vol.Coerce(float),
-        vol.Optional(CONF_WEATHER_SLOPE_BOOST, default=DEFAULT_WEATHER_SLOPE_BOOST): vol.Coerce(float),
-        vol.Optional(CONF_WEATHER_OFFSET, default=DEFAULT_WEATHER_OFFSET): vol.Coerce(float),
-        vol.Optional(CONF_LOG_LEVEL): cv.string,
-        vol.Required(CONF_ZONES): vol.All(cv.ensure_list, [ZONE_SCHEMA]),
+        CONF_UPDATE_INTERVAL: _field(
+            data, CONF_UPDATE_INTERVAL, _update_interval, DEFAULT_UPDATE_INTERVAL
+        ),
+        CONF_WEATHER_REF: _field(data, CONF_WEATHER_REF, _number, DEFAULT_WEATHER_REF),
+        CONF_WEATHER_SLOPE_ECO: _field(
+            data, CONF_WEATHER_SLOPE_ECO, _number, DEFAULT_WEATHER_SLOPE_ECO
+        ),
+        CONF_WEATHER_SLOPE_BOOST: _field(
+            data, CONF_WEATHER_SLOPE_BOOST, _number, DEFAULT_WEATHER_SLOPE_BOOST
+        ),
+        CONF_WEATHER_OFFSET: _field(
+            data, CONF_WEATHER_OFFSET, _number, DEFAULT_WEATHER_OFFSET
+        ),
+        CONF_ZONES: _field(data, CONF_ZONES, _validate_zones),
     }
-)
+    for key in (CONF_FLOW_SENSOR_ENTITY, CONF_AGGRESSIVENESS_ENTITY):
+        if key in data:
+            controller[key] = _field(data, key, cv.entity_id)
+    if CONF_LOG_LEVEL in data:
+        controller[CONF_LOG_LEVEL] = _field(data, CONF_LOG_LEVEL, cv.string)
+    return controller
+
+
+def _validate_controllers(value: Any) -> list[dict[str, Any]]:
+    """Validate the whole ``modulating_thermostat:`` block in one call."""
+    controllers: list[dict[str, Any]] = []
+    for index, controller in enumerate(cv.ensure_list(_extract_controllers(value))):
+        try:
+            controllers.append(_validate_controller(controller))
+        except vol.Invalid as err:
+            err.prepend([index])
+            raise
+    return controllers
 
-CONFIG_SCHEMA = vol.Schema(
-    {DOMAIN: vol.All(_extract_controllers, cv.ensure_list, [CONTROLLER_SCHEMA])}, extra=vol.ALLOW_EXTRA
-)
 
 async def async_setup(hass: HomeAssistant, config: Mapping[str, Any]) -> bool:
     hass.data.setdefault(DOMAIN, {})
     await async_setup_reload_service(hass, DOMAIN, PLATFORMS)
 
+    # There is no CONFIG_SCHEMA: most installs only use the config flow, so
+    # the YAML block is validated here and only when it is present.
     yaml_config = config.get(DOMAIN)
     if yaml_config:
-        for controller_data in yaml_config:
+        try:
+            controllers = _validate_controllers(yaml_config)
+        except vol.Invalid as err:
+            _LOGGER.error("Invalid %s configuration: %s", DOMAIN, err)
+            return False
+        for controller_data in controllers:
             hass.async_create_task(
                 hass.config_entries.flow.async_init(
                     DOMAIN,
@@ -125,7 +266,8 @@ async def async_setup(hass: HomeAssistant, config: Mapping[str, Any]) -> bool:
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     data = merge_entry_data(entry)
     coordinator = ModulatingThermostatCoordinator(hass, entry.entry_id, data)
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    # async_setup always runs first and creates the domain bucket.
+    hass.data[DOMAIN][entry.entry_id] = coordinator
     await coordinator.async_load_runtime()
     await coordinator.async_config_entry_first_refresh()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
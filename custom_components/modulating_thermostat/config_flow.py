@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
+import re
+from collections import ChainMap
+from collections.abc import Mapping
+from functools import cache, lru_cache
+from typing import Any, cast
 
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import callback
-from homeassistant.helpers import selector
 from homeassistant.util import slugify
 
 from .const import (
@@ -47,7 +50,105 @@ from .const import (
 )
 
 
-ENTITY_SELECTOR: Any = selector.EntitySelector(selector.EntitySelectorConfig())  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
+@cache
+def _entity_selector() -> Any:
+    """Build the shared entity selector the first time a form is rendered."""
+    from homeassistant.helpers import selector
+
+    return selector.EntitySelector(selector.EntitySelectorConfig())  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
+
+
+# Zone ids and controller names repeat across imports and form redraws.
+_slugify = lru_cache(maxsize=256)(slugify)
+
+# Checked in the zone step rather than via vol.Match, which the frontend
+# schema serializer cannot represent.
+_ZONE_ID_RE = re.compile(r"^[a-zA-Z0-9_\-]+$")
+
+_FLOAT = vol.Coerce(float)
+_PERCENT = vol.All(_FLOAT, vol.Range(min=0, max=100))
+_NON_NEGATIVE = vol.All(_FLOAT, vol.Range(min=0.0))
+_DEADBAND = vol.All(_FLOAT, vol.Range(min=0.0, max=2.0))
+_UPDATE_INTERVAL = vol.All(vol.Coerce(int), vol.Range(min=10, max=600))
+
+# (marker, key, default, validator); _entity_selector stands in for the
+# selector itself until a form is actually built.
+_FormField = tuple[type[vol.Required | vol.Optional], str, Any, Any]
+
+# Field templates are built once at import so every form render reuses the
+# same validator objects and only splices in the current defaults.
+_USER_FIELDS: tuple[_FormField, ...] = (
+    (vol.Required, CONF_NAME, "Modulating thermostat", str),
+    (vol.Required, CONF_OUTDOOR_ENTITY, None, _entity_selector),
+    (vol.Optional, CONF_FLOW_SENSOR_ENTITY, None, _entity_selector),
+    (vol.Optional, CONF_AGGRESSIVENESS_ENTITY, None, _entity_selector),
+    (
+        vol.Required,
+        CONF_DEFAULT_AGGRESSIVENESS,
+        DEFAULT_DEFAULT_AGGRESSIVENESS,
+        _PERCENT,
+    ),
+    (vol.Required, CONF_OUTPUT_MIN, DEFAULT_OUTPUT_MIN, _FLOAT),
+    (vol.Required, CONF_OUTPUT_MAX, DEFAULT_OUTPUT_MAX, _FLOAT),
+    (vol.Required, CONF_ACTIVE_MIN_FLOW, DEFAULT_ACTIVE_MIN_FLOW, _FLOAT),
+    (vol.Required, CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL, _UPDATE_INTERVAL),
+    (vol.Required, CONF_WEATHER_REF, DEFAULT_WEATHER_REF, _FLOAT),
+    (vol.Required, CONF_WEATHER_SLOPE_ECO, DEFAULT_WEATHER_SLOPE_ECO, _FLOAT),
+    (vol.Required, CONF_WEATHER_SLOPE_BOOST, DEFAULT_WEATHER_SLOPE_BOOST, _FLOAT),
+    (vol.Required, CONF_WEATHER_OFFSET, DEFAULT_WEATHER_OFFSET, _FLOAT),
+)
+
+_ZONE_FIELDS: tuple[_FormField, ...] = (
+    (vol.Optional, CONF_ZONE_NAME, None, str),
+    (vol.Required, CONF_ZONE_ID, None, str),
+    (vol.Required, CONF_WEIGHT, 1.0, _NON_NEGATIVE),
+    (vol.Required, CONF_TEMPERATURE_ENTITY, None, _entity_selector),
+    (vol.Required, CONF_SETPOINT_ENTITY, None, _entity_selector),
+    (vol.Optional, CONF_ACTUATOR_ENTITY, None, _entity_selector),
+    (vol.Optional, CONF_ACTUATOR_MIN, 0.0, _FLOAT),
+    (vol.Optional, CONF_ACTUATOR_MAX, 100.0, _FLOAT),
+    (vol.Optional, CONF_DEADBAND, DEFAULT_DEADBAND, _DEADBAND),
+    (vol.Optional, "add_another", False, bool),
+)
+
+_OPTIONS_DEFAULTS: dict[str, Any] = {
+    CONF_DEFAULT_AGGRESSIVENESS: DEFAULT_DEFAULT_AGGRESSIVENESS,
+    CONF_OUTPUT_MIN: DEFAULT_OUTPUT_MIN,
+    CONF_OUTPUT_MAX: DEFAULT_OUTPUT_MAX,
+    CONF_ACTIVE_MIN_FLOW: DEFAULT_ACTIVE_MIN_FLOW,
+    CONF_WEATHER_SLOPE_ECO: DEFAULT_WEATHER_SLOPE_ECO,
+    CONF_WEATHER_SLOPE_BOOST: DEFAULT_WEATHER_SLOPE_BOOST,
+    CONF_WEATHER_OFFSET: DEFAULT_WEATHER_OFFSET,
+}
+
+_OPTIONS_VALIDATORS: dict[str, Any] = {
+    CONF_DEFAULT_AGGRESSIVENESS: _PERCENT,
+    CONF_OUTPUT_MIN: _FLOAT,
+    CONF_OUTPUT_MAX: _FLOAT,
+    CONF_ACTIVE_MIN_FLOW: _FLOAT,
+    CONF_WEATHER_SLOPE_ECO: _FLOAT,
+    CONF_WEATHER_SLOPE_BOOST: _FLOAT,
+    CONF_WEATHER_OFFSET: _FLOAT,
+}
+
+
+def _schema_from_fields(
+    fields: tuple[_FormField, ...],
+    defaults: dict[str, Any],
+) -> vol.Schema:
+    schema: dict[vol.Marker, Any] = {}
+    for marker, key, default, validator in fields:
+        if validator is _entity_selector:
+            validator = _entity_selector()
+        value = defaults.get(key, default)
+        if marker is vol.Optional and default is None:
+            # A None default would be fed through the validator on every
+            # submit (and rejected); suggest the value instead so blank
+            # optional fields are skipped entirely.
+            schema[marker(key, description={"suggested_value": value})] = validator
+        else:
+            schema[marker(key, default=value)] = validator
+    return vol.Schema(schema)
 
 
 class ModulatingThermostatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -57,37 +158,27 @@ class ModulatingThermostatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         self._config_data: dict[str, Any] = {}
         self._zones: list[dict[str, Any]] = []
+        self._zone_ids: set[str] = set()
         self._zone_counter = 1
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
         if user_input is not None:
-            output_min = float(user_input[CONF_OUTPUT_MIN])
-            output_max = float(user_input[CONF_OUTPUT_MAX])
-            if output_max <= output_min:
+            if user_input[CONF_OUTPUT_MAX] <= user_input[CONF_OUTPUT_MIN]:
                 return self.async_show_form(
                     step_id="user",
                     data_schema=self._user_schema(user_input),
                     errors={CONF_OUTPUT_MAX: "max_must_exceed_min"},
                 )
 
+            # The form schema has already coerced every value, so the stored
+            # config is simply the user fields in declaration order; blank
+            # optional entities are absent from user_input and stay absent.
             self._config_data = {
-                CONF_NAME: user_input[CONF_NAME],
-                CONF_OUTDOOR_ENTITY: user_input[CONF_OUTDOOR_ENTITY],
-                CONF_FLOW_SENSOR_ENTITY: user_input.get(CONF_FLOW_SENSOR_ENTITY),
-                CONF_AGGRESSIVENESS_ENTITY: user_input.get(CONF_AGGRESSIVENESS_ENTITY),
-                CONF_DEFAULT_AGGRESSIVENESS: float(
-                    user_input[CONF_DEFAULT_AGGRESSIVENESS]
-                ),
-                CONF_OUTPUT_MIN: output_min,
-                CONF_OUTPUT_MAX: output_max,
-                CONF_ACTIVE_MIN_FLOW: float(user_input[CONF_ACTIVE_MIN_FLOW]),
-                CONF_UPDATE_INTERVAL: int(user_input[CONF_UPDATE_INTERVAL]),
-                CONF_WEATHER_REF: float(user_input[CONF_WEATHER_REF]),
-                CONF_WEATHER_SLOPE_ECO: float(user_input[CONF_WEATHER_SLOPE_ECO]),
-                CONF_WEATHER_SLOPE_BOOST: float(user_input[CONF_WEATHER_SLOPE_BOOST]),
-                CONF_WEATHER_OFFSET: float(user_input[CONF_WEATHER_OFFSET]),
+                key: user_input[key]
+                for _, key, _, _ in _USER_FIELDS
+                if key in user_input
             }
             return await self.async_step_zone()
 
@@ -97,9 +188,14 @@ class ModulatingThermostatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
         if user_input is not None:
+            if not _ZONE_ID_RE.match(user_input[CONF_ZONE_ID]):
+                return self.async_show_form(
+                    step_id="zone",
+                    data_schema=self._zone_schema(user_input=user_input),
+                    errors={CONF_ZONE_ID: "invalid_zone_id"},
+                )
             zone = self._build_zone(user_input)
-            zone_ids = {existing[CONF_ZONE_ID] for existing in self._zones}
-            if zone[CONF_ZONE_ID] in zone_ids:
+            if zone[CONF_ZONE_ID] in self._zone_ids:
                 return self.async_show_form(
                     step_id="zone",
                     data_schema=self._zone_schema(user_input=user_input),
@@ -107,154 +203,62 @@ class ModulatingThermostatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 )
 
             self._zones.append(zone)
+            self._zone_ids.add(zone[CONF_ZONE_ID])
             if user_input.get("add_another", False):
                 self._zone_counter += 1
                 return self.async_show_form(
                     step_id="zone", data_schema=self._zone_schema()
                 )
 
-            data = dict(self._config_data)
-            data[CONF_ZONES] = self._zones
+            # The flow is discarded once the entry is created, so the
+            # collected config can be handed over without copying.
+            self._config_data[CONF_ZONES] = self._zones
             return self.async_create_entry(
-                title=self._config_data[CONF_NAME], data=data
+                title=self._config_data[CONF_NAME], data=self._config_data
             )
 
         return self.async_show_form(step_id="zone", data_schema=self._zone_schema())
 
     def _user_schema(self, user_input: dict[str, Any] | None = None) -> vol.Schema:
-        defaults = user_input or {}
-        return vol.Schema(
-            {
-                vol.Required(
-                    CONF_NAME, default=defaults.get(CONF_NAME, "Modulating thermostat")
-                ): str,
-                vol.Required(
-                    CONF_OUTDOOR_ENTITY, default=defaults.get(CONF_OUTDOOR_ENTITY)
-                ): ENTITY_SELECTOR,
-                vol.Optional(
-                    CONF_FLOW_SENSOR_ENTITY,
-                    default=defaults.get(CONF_FLOW_SENSOR_ENTITY),
-                ): ENTITY_SELECTOR,
-                vol.Optional(
-                    CONF_AGGRESSIVENESS_ENTITY,
-                    default=defaults.get(CONF_AGGRESSIVENESS_ENTITY),
-                ): ENTITY_SELECTOR,
-                vol.Required(
-                    CONF_DEFAULT_AGGRESSIVENESS,
-                    default=defaults.get(
-                        CONF_DEFAULT_AGGRESSIVENESS, DEFAULT_DEFAULT_AGGRESSIVENESS
-                    ),
-                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
-                vol.Required(
-                    CONF_OUTPUT_MIN,
-                    default=defaults.get(CONF_OUTPUT_MIN, DEFAULT_OUTPUT_MIN),
-                ): vol.Coerce(float),
-                vol.Required(
-                    CONF_OUTPUT_MAX,
-                    default=defaults.get(CONF_OUTPUT_MAX, DEFAULT_OUTPUT_MAX),
-                ): vol.Coerce(float),
-                vol.Required(
-                    CONF_ACTIVE_MIN_FLOW,
-                    default=defaults.get(CONF_ACTIVE_MIN_FLOW, DEFAULT_ACTIVE_MIN_FLOW),
-                ): vol.Coerce(float),
-                vol.Required(
-                    CONF_UPDATE_INTERVAL,
-                    default=defaults.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
-                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=600)),
-                vol.Required(
-                    CONF_WEATHER_REF,
-                    default=defaults.get(CONF_WEATHER_REF, DEFAULT_WEATHER_REF),
-                ): vol.Coerce(float),
-                vol.Required(
-                    CONF_WEATHER_SLOPE_ECO,
-                    default=defaults.get(
-                        CONF_WEATHER_SLOPE_ECO, DEFAULT_WEATHER_SLOPE_ECO
-                    ),
-                ): vol.Coerce(float),
-                vol.Required(
-                    CONF_WEATHER_SLOPE_BOOST,
-                    default=defaults.get(
-                        CONF_WEATHER_SLOPE_BOOST, DEFAULT_WEATHER_SLOPE_BOOST
-                    ),
-                ): vol.Coerce(float),
-                vol.Required(
-                    CONF_WEATHER_OFFSET,
-                    default=defaults.get(CONF_WEATHER_OFFSET, DEFAULT_WEATHER_OFFSET),
-                ): vol.Coerce(float),
-            }
-        )
+        return _schema_from_fields(_USER_FIELDS, user_input or {})
 
     def _zone_schema(self, user_input: dict[str, Any] | None = None) -> vol.Schema:
-        defaults = user_input or {}
-        default_zone_id = defaults.get(CONF_ZONE_ID, f"zone_{self._zone_counter}")
-        return vol.Schema(
-            {
-                vol.Optional(CONF_ZONE_NAME, default=defaults.get(CONF_ZONE_NAME)): str,
-                vol.Required(
-                    CONF_ZONE_ID,
-                    default=default_zone_id,
-                ): vol.Match(r"^[a-zA-Z0-9_\-]+$"),
-                vol.Required(
-                    CONF_WEIGHT, default=defaults.get(CONF_WEIGHT, 1.0)
-                ): vol.All(vol.Coerce(float), vol.Range(min=0.0)),
-                vol.Required(
-                    CONF_TEMPERATURE_ENTITY,
-                    default=defaults.get(CONF_TEMPERATURE_ENTITY),
-                ): ENTITY_SELECTOR,
-                vol.Required(
-                    CONF_SETPOINT_ENTITY, default=defaults.get(CONF_SETPOINT_ENTITY)
-                ): ENTITY_SELECTOR,
-                vol.Optional(
-                    CONF_ACTUATOR_ENTITY, default=defaults.get(CONF_ACTUATOR_ENTITY)
-                ): ENTITY_SELECTOR,
-                vol.Optional(
-                    CONF_ACTUATOR_MIN, default=defaults.get(CONF_ACTUATOR_MIN, 0.0)
-                ): vol.Coerce(float),
-                vol.Optional(
-                    CONF_ACTUATOR_MAX, default=defaults.get(CONF_ACTUATOR_MAX, 100.0)
-                ): vol.Coerce(float),
-                vol.Optional(
-                    CONF_DEADBAND, default=defaults.get(CONF_DEADBAND, DEFAULT_DEADBAND)
-                ): vol.All(vol.Coerce(float), vol.Range(min=0.0, max=2.0)),
-                vol.Optional(
-                    "add_another", default=defaults.get("add_another", False)
-                ): bool,
-            }
-        )
+        defaults = {CONF_ZONE_ID: f"zone_{self._zone_counter}", **(user_input or {})}
+        return _schema_from_fields(_ZONE_FIELDS, defaults)
 
     async def async_step_import(
         self, user_input: dict[str, Any]
     ) -> config_entries.ConfigFlowResult:
         data = dict(user_input)
-        zones: list[dict[str, Any]] = []
-        for zone in data.get(CONF_ZONES, []):
-            zone_copy = dict(zone)
-            zone_copy[CONF_ZONE_ID] = slugify(zone_copy[CONF_ZONE_ID])
-            zone_copy.setdefault(CONF_ZONE_NAME, zone_copy[CONF_ZONE_ID])
-            zones.append(zone_copy)
+        # Zone dicts come from this import's validated YAML and are not
+        # shared, so they are normalised in place.
+        zones: list[dict[str, Any]] = data.get(CONF_ZONES, [])
+        for zone in zones:
+            zone[CONF_ZONE_ID] = _slugify(zone[CONF_ZONE_ID])
+            zone.setdefault(CONF_ZONE_NAME, zone[CONF_ZONE_ID])
         data[CONF_ZONES] = zones
-        unique_id = slugify(data[CONF_NAME])
+        unique_id = _slugify(data[CONF_NAME])
         await self.async_set_unique_id(unique_id)
         self._abort_if_unique_id_configured(updates=data)
         return self.async_create_entry(title=data[CONF_NAME], data=data)
 
     def _build_zone(self, raw: dict[str, Any]) -> dict[str, Any]:
         """Build a sanitized zone dict from form input."""
-        zone_id = slugify(raw[CONF_ZONE_ID])
+        zone_id = _slugify(raw[CONF_ZONE_ID])
         zone_name = raw.get(CONF_ZONE_NAME) or zone_id
         zone: dict[str, Any] = {
             CONF_ZONE_ID: zone_id,
             CONF_ZONE_NAME: zone_name,
-            CONF_WEIGHT: float(raw[CONF_WEIGHT]),
+            CONF_WEIGHT: raw[CONF_WEIGHT],
             CONF_TEMPERATURE_ENTITY: raw[CONF_TEMPERATURE_ENTITY],
             CONF_SETPOINT_ENTITY: raw[CONF_SETPOINT_ENTITY],
-            CONF_DEADBAND: float(raw[CONF_DEADBAND]),
+            CONF_DEADBAND: raw[CONF_DEADBAND],
         }
         actuator_entity = raw.get(CONF_ACTUATOR_ENTITY)
         if actuator_entity:
             zone[CONF_ACTUATOR_ENTITY] = actuator_entity
-            zone[CONF_ACTUATOR_MIN] = float(raw.get(CONF_ACTUATOR_MIN, 0.0))
-            zone[CONF_ACTUATOR_MAX] = float(raw.get(CONF_ACTUATOR_MAX, 100.0))
+            zone[CONF_ACTUATOR_MIN] = raw.get(CONF_ACTUATOR_MIN, 0.0)
+            zone[CONF_ACTUATOR_MAX] = raw.get(CONF_ACTUATOR_MAX, 100.0)
         return zone
 
     @staticmethod
@@ -273,22 +277,19 @@ class ModulatingThermostatOptionsFlow(config_entries.OptionsFlow):
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
-        current: dict[str, Any] = dict(self.config_entry.data)
-        current.update(self.config_entry.options)
+        # Options override data, which overrides the built-in defaults; a
+        # ChainMap gives that view without copying.
+        current: Mapping[str, Any] = ChainMap(
+            cast(dict[str, Any], self.config_entry.options),
+            cast(dict[str, Any], self.config_entry.data),
+            _OPTIONS_DEFAULTS,
+        )
 
         if user_input is not None:
             updated = dict(self.config_entry.options)
             updated.update(user_input)
-            output_min = float(
-                updated.get(
-                    CONF_OUTPUT_MIN, current.get(CONF_OUTPUT_MIN, DEFAULT_OUTPUT_MIN)
-                )
-            )
-            output_max = float(
-                updated.get(
-                    CONF_OUTPUT_MAX, current.get(CONF_OUTPUT_MAX, DEFAULT_OUTPUT_MAX)
-                )
-            )
+            output_min = float(updated.get(CONF_OUTPUT_MIN, current[CONF_OUTPUT_MIN]))
+            output_max = float(updated.get(CONF_OUTPUT_MAX, current[CONF_OUTPUT_MAX]))
             if output_max <= output_min:
                 return self.async_show_form(
                     step_id="init",
@@ -304,64 +305,13 @@ class ModulatingThermostatOptionsFlow(config_entries.OptionsFlow):
 
     def _build_schema(
         self,
-        current: dict[str, Any],
+        current: Mapping[str, Any],
         user_input: dict[str, Any] | None,
     ) -> vol.Schema:
         source = user_input or current
         return vol.Schema(
             {
-                vol.Optional(
-                    CONF_DEFAULT_AGGRESSIVENESS,
-                    default=source.get(
-                        CONF_DEFAULT_AGGRESSIVENESS,
-                        current.get(
-                            CONF_DEFAULT_AGGRESSIVENESS, DEFAULT_DEFAULT_AGGRESSIVENESS
-                        ),
-                    ),
-                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
-                vol.Optional(
-                    CONF_OUTPUT_MIN,
-                    default=source.get(
-                        CONF_OUTPUT_MIN,
-                        current.get(CONF_OUTPUT_MIN, DEFAULT_OUTPUT_MIN),
-                    ),
-                ): vol.Coerce(float),
-                vol.Optional(
-                    CONF_OUTPUT_MAX,
-                    default=source.get(
-                        CONF_OUTPUT_MAX,
-                        current.get(CONF_OUTPUT_MAX, DEFAULT_OUTPUT_MAX),
-                    ),
-                ): vol.Coerce(float),
-                vol.Optional(
-                    CONF_ACTIVE_MIN_FLOW,
-                    default=source.get(
-                        CONF_ACTIVE_MIN_FLOW,
-                        current.get(CONF_ACTIVE_MIN_FLOW, DEFAULT_ACTIVE_MIN_FLOW),
-                    ),
-                ): vol.Coerce(float),
-                vol.Optional(
-                    CONF_WEATHER_SLOPE_ECO,
-                    default=source.get(
-                        CONF_WEATHER_SLOPE_ECO,
-                        current.get(CONF_WEATHER_SLOPE_ECO, DEFAULT_WEATHER_SLOPE_ECO),
-                    ),
-                ): vol.Coerce(float),
-                vol.Optional(
-                    CONF_WEATHER_SLOPE_BOOST,
-                    default=source.get(
-                        CONF_WEATHER_SLOPE_BOOST,
-                        current.get(
-                            CONF_WEATHER_SLOPE_BOOST, DEFAULT_WEATHER_SLOPE_BOOST
-                        ),
-                    ),
-                ): vol.Coerce(float),
-                vol.Optional(
-                    CONF_WEATHER_OFFSET,
-                    default=source.get(
-                        CONF_WEATHER_OFFSET,
-                        current.get(CONF_WEATHER_OFFSET, DEFAULT_WEATHER_OFFSET),
-                    ),
-                ): vol.Coerce(float),
+                vol.Optional(key, default=source.get(key, current[key])): validator
+                for key, validator in _OPTIONS_VALIDATORS.items()
             }
         )
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 import re
 import time
-from contextlib import suppress
+from collections.abc import Callable, Sequence
 from datetime import timedelta
 from typing import Any, cast
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
@@ -18,7 +17,6 @@ from .models import (
     ControllerConfig,
     ControllerState,
     ZoneDiagnostics,
-    ZoneRuntime,
     controller_config_from_entry,
 )
 from .const import DOMAIN, STORAGE_VERSION
@@ -40,6 +38,11 @@ PID_KI_BOOST = 0.003
 INTEGRAL_MAX = 1.0
 FLOW_KP = 0.2
 FLOW_TRIM_MAX = 5.0
+SAVE_DELAY = 60
+SETTLED_INTEGRAL_TERM = 1e-6
+
+_NUMERIC_RE = re.compile(r"[-+]?[0-9]*\.?[0-9]+")
+_UNAVAILABLE = frozenset({"unknown", "unavailable", "none", ""})
 
 
 def _clamp(value: float, lower: float, upper: float) -> float:
@@ -50,27 +53,85 @@ def _lerp(a: float, b: float, factor: float) -> float:
     return (1.0 - factor) * a + factor * b
 
 
-def _safe_float(state: StateType) -> float | None:
-    """Best-effort conversion of Home Assistant states/attributes to float."""
-    if state is None:
-        return None
-    if isinstance(state, (int, float)):
-        return float(state)
-    cleaned = str(state).strip()
-    if cleaned.lower() in {"unknown", "unavailable", "none"}:
-        return None
+def _safe_float_str(state: str) -> float | None:
     try:
-        return float(cleaned)
+        return float(state)
     except ValueError:
-        match = re.search(r"[-+]?[0-9]*[.]?[0-9]+", cleaned.replace(",", "."))
-        if match:
-            try:
-                return float(match.group())
-            except ValueError:
-                return None
+        pass
+    cleaned = state.strip()
+    if cleaned.lower() in _UNAVAILABLE:
+        return None
+    match = _NUMERIC_RE.search(cleaned.replace(",", "."))
+    if match:
+        try:
+            return float(match.group())
+        except ValueError:
+            return None
+    return None
+
+
+def _none(_: Any) -> None:
     return None
 
 
+# Keyed on the exact type so the common str/float states skip isinstance
+# checks; anything else is converted through its string form.
+_FLOAT_CONVERTERS: dict[type, Callable[[Any], float | None]] = {
+    str: _safe_float_str,
+    float: float,
+    int: float,
+    bool: float,
+    type(None): _none,
+}
+
+
+def _safe_float(state: StateType) -> float | None:
+    """Best-effort conversion of Home Assistant states/attributes to float."""
+    converter = _FLOAT_CONVERTERS.get(type(state))
+    if converter is not None:
+        return converter(state)
+    return _safe_float_str(str(state))
+
+
+def _pi_step(
+    error: float, integral: float, dt: float, kp: float, ki: float
+) -> tuple[float, float]:
+    """Advance one zone's PI controller by one step.
+
+    ``error`` has already had the deadband applied. Returns the new integral
+    and the demand clipped to 0-1.
+    """
+    if error == 0.0:
+        integral *= 0.8
+    else:
+        integral += error * dt
+    # Anti-windup: bound the integral in its own units so the integral
+    # term never exceeds INTEGRAL_MAX.
+    if ki > 0:
+        limit = INTEGRAL_MAX / ki
+        integral = _clamp(integral, -limit, limit)
+    return integral, _clamp(kp * error + integral * ki, 0.0, 1.0)
+
+
+def _combine_demand(
+    outputs: Sequence[float], weights: Sequence[float], aggressiveness: float
+) -> tuple[float, float, float]:
+    """Blend weighted average and peak zone demand by aggressiveness.
+
+    Returns ``(average, peak, combined)``. Zones with zero weight do not
+    count towards either figure.
+    """
+    total_weight = sum(weights)
+    if total_weight <= 0:
+        return 0.0, 0.0, 0.0
+    weighted = [weight * output for weight, output in zip(weights, outputs)]
+    average = sum(weighted) / total_weight
+    # Peak demand scales each zone against the heaviest available zone.
+    peak = max(weighted) / max(weights)
+    combined = _clamp(_lerp(average, peak, aggressiveness), 0.0, 1.0)
+    return average, peak, combined
+
+
 def _resolve_log_level(config: ControllerConfig) -> int:
     """Map a configured log level string to a logging module constant."""
     default_level = logging.INFO
@@ -91,9 +152,10 @@ class ModulatingThermostatCoordinator(DataUpdateCoordinator[ControllerState]):
         self._entry_id = entry_id
         self._config = controller_config_from_entry(entry_data)
         log_level = _resolve_log_level(self._config)
-        slug = slugify(self._config.name)
-        self._logger = logging.getLogger(f"{__name__}.{slug}")
+        self._name_slug = slugify(self._config.name)
+        self._logger = logging.getLogger(f"{__name__}.{self._name_slug}")
         self._logger.setLevel(log_level)
+        self._debug = self._logger.isEnabledFor(logging.DEBUG)
         self._logger.debug(
             "Coordinator initialised with log level %s", logging.getLevelName(log_level)
         )
@@ -103,7 +165,8 @@ class ModulatingThermostatCoordinator(DataUpdateCoordinator[ControllerState]):
             f"{DOMAIN}_{entry_id}.json",
             private=True,
         )
-        self._save_task: asyncio.Task[None] | None = None
+        self._save_pending = False
+        self._last_saved_integrals: tuple[float, ...] = ()
         update_interval = timedelta(seconds=self._config.update_interval)
         super().__init__(
             hass,
@@ -111,274 +174,312 @@ class ModulatingThermostatCoordinator(DataUpdateCoordinator[ControllerState]):
             name=f"Modulating thermostat ({self._config.name})",
             update_interval=update_interval,
         )
-        self._zone_runtime = {
-            zone.zone_id: ZoneRuntime() for zone in self._config.zones
-        }
-        self._last_monotonic = time.monotonic()
-
+        self._init_zone_state()
+        self._last_monotonic_ns = time.monotonic_ns()
+
+    def _init_zone_state(self) -> None:
+        """Reset per-zone runtime state and collect the entities to read."""
+        zones = self._config.zones
+        self._integrals = [0.0] * len(zones)
+        # (actuator_min, span) for zones with both bounds configured.
+        self._actuator_ranges = [
+            None
+            if zone.actuator_min is None or zone.actuator_max is None
+            else (zone.actuator_min, zone.actuator_max - zone.actuator_min)
+            for zone in zones
+        ]
+        self._zone_index = {zone.zone_id: index for index, zone in enumerate(zones)}
+        self._last_fingerprint: tuple[float | None, ...] = ()
+        self._last_state: ControllerState | None = None
+        self._settled = False
+        # Diagnostics follow zone order and are updated in place; entities
+        # only read them.
+        self._zone_diagnostics = [ZoneDiagnostics() for _ in zones]
+        referenced = [
+            self._config.aggressiveness_entity,
+            self._config.outdoor_entity,
+            self._config.flow_sensor_entity,
+        ]
+        for zone in zones:
+            referenced += (
+                zone.temperature_entity,
+                zone.setpoint_entity,
+                zone.actuator_entity,
+            )
+        self._entity_ids = [
+            entity_id for entity_id in dict.fromkeys(referenced) if entity_id
+        ]
 
     @property
     def config(self) -> ControllerConfig:
         return self._config
 
+    @property
+    def name_slug(self) -> str:
+        return self._name_slug
+
     async def _async_update_data(self) -> ControllerState:
         if not self._config.zones:
             raise UpdateFailed("No zones configured")
 
-        now = time.monotonic()
-        dt = now - self._last_monotonic
-        if dt <= 0:
-            dt = self._config.update_interval
-        self._last_monotonic = now
-
-        aggressiveness_raw = self._read_numeric_entity(
-            self._config.aggressiveness_entity
+        # Refreshed per update so runtime log level changes are honoured
+        # without paying for argument packing on every suppressed call.
+        self._debug = self._logger.isEnabledFor(logging.DEBUG)
+
+        now_ns = time.monotonic_ns()
+        elapsed_ns = now_ns - self._last_monotonic_ns
+        self._last_monotonic_ns = now_ns
+        dt = elapsed_ns * 1e-9 if elapsed_ns > 0 else self._config.update_interval
+
+        # Fetch every referenced entity once, even when zones share sensors.
+        states = self.hass.states
+        snapshot = [states.get(entity_id) for entity_id in self._entity_ids]
+        fingerprint = tuple(
+            None if state is None else state.last_updated_timestamp
+            for state in snapshot
         )
+        if (
+            self._settled
+            and fingerprint == self._last_fingerprint
+            and self._last_state is not None
+        ):
+            # No input changed and no zone is integrating, so the previous
+            # result still stands.
+            if self._debug:
+                self._logger.debug("Inputs unchanged and settled; reusing last state")
+            return self._last_state
+        self._last_fingerprint = fingerprint
+
+        parse = self._numeric_state
+        readings: dict[str | None, float | None] = {
+            entity_id: parse(entity_id, state)
+            for entity_id, state in zip(self._entity_ids, snapshot)
+        }
+
+        aggressiveness_raw = readings.get(self._config.aggressiveness_entity)
         if aggressiveness_raw is None:
             aggressiveness_raw = self._config.default_aggressiveness
         aggressiveness = _clamp(aggressiveness_raw * AGGRESSIVENESS_SCALE, 0.0, 1.0)
-        self._logger.debug(
-            "Aggressiveness raw=%.2f scaled=%.3f", aggressiveness_raw, aggressiveness
-        )
-
-        outdoor_temp = self._read_numeric_entity(self._config.outdoor_entity)
-        flow_temp = self._read_numeric_entity(self._config.flow_sensor_entity)
-        self._logger.debug(
-            "Outdoor temperature=%s flow sensor=%s", outdoor_temp, flow_temp
-        )
+        if self._debug:
+            self._logger.debug(
+                "Aggressiveness raw=%.2f scaled=%.3f", aggressiveness_raw, aggressiveness
+            )
 
-        zone_diagnostics: dict[str, ZoneDiagnostics] = {}
-        total_weight = 0.0
-        weighted_demand_sum = 0.0
-        peak_demand = 0.0
-        max_zone_weight = 0.0
+        outdoor_temp = readings.get(self._config.outdoor_entity)
+        flow_temp = readings.get(self._config.flow_sensor_entity)
+        if self._debug:
+            self._logger.debug(
+                "Outdoor temperature=%s flow sensor=%s", outdoor_temp, flow_temp
+            )
 
-        for zone in self._config.zones:
-            zone_runtime = self._zone_runtime.setdefault(zone.zone_id, ZoneRuntime())
-            diagnostics = ZoneDiagnostics()
+        kp = _lerp(PID_KP_ECO, PID_KP_BOOST, aggressiveness)
+        ki = _lerp(PID_KI_ECO, PID_KI_BOOST, aggressiveness)
 
-            current_temp = self._read_numeric_entity(zone.temperature_entity)
-            target_temp = self._read_numeric_entity(zone.setpoint_entity)
-            diagnostics.temperature = current_temp
-            diagnostics.target = target_temp
+        integrals = self._integrals
+        zone_diagnostics = self._zone_diagnostics
+        outputs: list[float] = []
+        weights: list[float] = []
+        settled = True
+        for index, zone in enumerate(self._config.zones):
+            current_temp = readings[zone.temperature_entity]
+            target_temp = readings[zone.setpoint_entity]
+            diagnostics = zone_diagnostics[index]
+            diagnostics.reset(current_temp, target_temp)
 
             if current_temp is None or target_temp is None:
-                self._logger.debug(
-                    "Zone %s skipped (temperature=%s target=%s)",
-                    zone.zone_id,
-                    current_temp,
-                    target_temp,
-                )
-                zone_runtime.available = False
-                zone_runtime.integral = 0.0
-                zone_diagnostics[zone.zone_id] = diagnostics
+                if self._debug:
+                    self._logger.debug(
+                        "Zone %s skipped (temperature=%s target=%s)",
+                        zone.zone_id,
+                        current_temp,
+                        target_temp,
+                    )
+                integrals[index] = 0.0
                 continue
 
-            zone_runtime.available = True
-
             error = target_temp - current_temp
             if abs(error) <= zone.deadband:
                 error = 0.0
-
-            kp = _lerp(PID_KP_ECO, PID_KP_BOOST, aggressiveness)
-            ki = _lerp(PID_KI_ECO, PID_KI_BOOST, aggressiveness)
-
-            if error == 0.0:
-                zone_runtime.integral *= 0.8
-            else:
-                zone_runtime.integral += error * dt
-            integral_term = zone_runtime.integral * ki
-            integral_term = _clamp(integral_term, -INTEGRAL_MAX, INTEGRAL_MAX)
-            if ki > 0:
-                zone_runtime.integral = integral_term / ki
-
-            proportional_term = kp * error
-            output = proportional_term + integral_term
-            output = _clamp(output, 0.0, 1.0)
+            integral, output = _pi_step(error, integrals[index], dt, kp, ki)
+            integrals[index] = integral
+            if error != 0.0 or abs(integral * ki) >= SETTLED_INTEGRAL_TERM:
+                settled = False
 
             actuator_ratio = 1.0
-            actuator_target: float | None = None
             if zone.actuator_entity:
-                actuator_value = self._read_numeric_entity(zone.actuator_entity)
-                if (
-                    actuator_value is not None
-                    and zone.actuator_min is not None
-                    and zone.actuator_max is not None
-                    and zone.actuator_max > zone.actuator_min
-                ):
-                    actuator_ratio = _clamp(
-                        (actuator_value - zone.actuator_min)
-                        / (zone.actuator_max - zone.actuator_min),
-                        0.0,
-                        1.0,
-                    )
-                    diagnostics.actuator_ratio = actuator_ratio
-                elif actuator_value is None:
-                    diagnostics.actuator_ratio = None
-                else:
-                    actuator_ratio = 1.0
-                    diagnostics.actuator_ratio = actuator_ratio
+                actuator_value = readings.get(zone.actuator_entity)
                 if actuator_value is not None:
-                    if zone.actuator_min is not None and zone.actuator_max is not None:
-                        span = zone.actuator_max - zone.actuator_min
-                        actuator_target = zone.actuator_min + output * span
+                    actuator_range = self._actuator_ranges[index]
+                    if actuator_range is None:
+                        diagnostics.actuator_target = output * 100.0
                     else:
-                        actuator_target = output * 100.0
-                    self._logger.debug(
-                        "Zone %s actuator target=%.3f (min=%s max=%s)",
-                        zone.zone_id,
-                        actuator_target,
-                        zone.actuator_min,
-                        zone.actuator_max,
-                    )
+                        actuator_min, span = actuator_range
+                        if span > 0:
+                            actuator_ratio = _clamp(
+                                (actuator_value - actuator_min) / span, 0.0, 1.0
+                            )
+                        diagnostics.actuator_target = actuator_min + output * span
+                    diagnostics.actuator_ratio = actuator_ratio
+                    if self._debug:
+                        self._logger.debug(
+                            "Zone %s actuator target=%.3f (min=%s max=%s)",
+                            zone.zone_id,
+                            diagnostics.actuator_target,
+                            zone.actuator_min,
+                            zone.actuator_max,
+                        )
+            else:
+                diagnostics.actuator_ratio = actuator_ratio
             diagnostics.error = error
             diagnostics.demand = output
+            diagnostics.weight_factor = zone.weight * actuator_ratio
 
-            weight_factor = zone.weight * actuator_ratio
-            diagnostics.weight_factor = weight_factor
-            if not zone.actuator_entity:
-                diagnostics.actuator_ratio = actuator_ratio
-            diagnostics.actuator_target = actuator_target
+            if self._debug:
+                self._logger.debug(
+                    "Zone %s: temp=%s target=%s error=%.3f demand=%.3f weight=%.3f actuator=%.3f",
+                    zone.zone_id,
+                    current_temp,
+                    target_temp,
+                    error,
+                    output,
+                    zone.weight,
+                    actuator_ratio,
+                )
+
+            outputs.append(output)
+            weights.append(zone.weight)
 
+        average_demand, peak_demand, combined_demand = _combine_demand(
+            outputs, weights, aggressiveness
+        )
+
+        if self._debug:
             self._logger.debug(
-                "Zone %s: temp=%s target=%s error=%.3f demand=%.3f weight=%.3f actuator=%.3f",
-                zone.zone_id,
-                current_temp,
-                target_temp,
-                error,
-                output,
-                zone.weight,
-                actuator_ratio,
+                "Demand summary: avg=%.3f peak=%.3f combined=%.3f",
+                average_demand,
+                peak_demand,
+                combined_demand,
             )
 
-            total_weight += zone.weight
-            weighted_demand_sum += zone.weight * output
-            max_zone_weight = max(max_zone_weight, zone.weight)
-            if max_zone_weight > 0:
-                peak_candidate = output * (zone.weight / max_zone_weight)
-            else:
-                peak_candidate = 0.0
-            peak_demand = max(peak_demand, peak_candidate)
+        weather_target, target_flow = self._compute_flow_target(
+            aggressiveness, outdoor_temp, flow_temp, combined_demand
+        )
 
-            zone_diagnostics[zone.zone_id] = diagnostics
+        if self._debug:
+            self._logger.debug(
+                "Update complete: target_flow=%.2f aggressiveness=%.3f combined_demand=%.3f",
+                target_flow,
+                aggressiveness,
+                combined_demand,
+            )
+        self._schedule_save_runtime()
 
-        combined_demand = 0.0
-        if total_weight > 0:
-            average_demand = weighted_demand_sum / total_weight
-            combined_demand = _lerp(average_demand, peak_demand, aggressiveness)
-            combined_demand = _clamp(combined_demand, 0.0, 1.0)
-        else:
-            average_demand = 0.0
-        self._logger.debug(
-            "Demand summary: avg=%.3f peak=%.3f combined=%.3f",
-            average_demand,
-            peak_demand,
-            combined_demand,
+        self._settled = settled
+        self._last_state = ControllerState(
+            target_flow_c=target_flow,
+            combined_demand=combined_demand,
+            aggressiveness=aggressiveness,
+            weather_target_c=weather_target,
+            zone_diagnostics=zone_diagnostics,
+            flow_sensor_value=flow_temp,
+            outdoor_temperature=outdoor_temp,
         )
+        return self._last_state
 
-        reference_temp = self._config.weather_reference_temperature
+    def _compute_flow_target(
+        self,
+        aggressiveness: float,
+        outdoor_temp: float | None,
+        flow_temp: float | None,
+        combined_demand: float,
+    ) -> tuple[float, float]:
+        """Return the weather-curve target and the demand-scaled flow target."""
+        config = self._config
+        output_min = config.output_min
+        output_max = config.output_max
+
+        reference_temp = config.weather_reference_temperature
         if outdoor_temp is not None:
             delta = max(reference_temp - outdoor_temp, 0.0)
         else:
             delta = reference_temp
 
         weather_slope = _lerp(
-            self._config.weather_slope_eco,
-            self._config.weather_slope_boost,
-            aggressiveness,
-        )
-        weather_target = self._config.weather_offset + weather_slope * delta
-        self._logger.debug(
-            "Weather compensation: slope=%.3f delta=%.3f target=%.2f",
-            weather_slope,
-            delta,
-            weather_target,
-        )
-        weather_target = _clamp(
-            weather_target, self._config.output_min, self._config.output_max
+            config.weather_slope_eco, config.weather_slope_boost, aggressiveness
         )
+        weather_target = config.weather_offset + weather_slope * delta
+        if self._debug:
+            self._logger.debug(
+                "Weather compensation: slope=%.3f delta=%.3f target=%.2f",
+                weather_slope,
+                delta,
+                weather_target,
+            )
+        weather_target = max(output_min, min(output_max, weather_target))
 
         if combined_demand <= 0:
-            target_flow = self._config.output_min
+            target_flow = output_min
         else:
-            active_floor = max(self._config.output_min, self._config.active_min_flow)
-            weather_limited = _clamp(
-                weather_target, active_floor, self._config.output_max
-            )
+            active_floor = max(output_min, config.active_min_flow)
+            weather_limited = max(active_floor, min(output_max, weather_target))
             target_flow = active_floor + (weather_limited - active_floor) * combined_demand
-            headroom = self._config.output_max - weather_limited
+            headroom = output_max - weather_limited
             if headroom > 0:
                 # Allow full-demand zones to climb beyond the weather curve without
                 # permanently abandoning compensation for milder conditions.
                 target_flow += headroom * combined_demand
-            target_flow = _clamp(
-                target_flow,
-                self._config.output_min,
-                self._config.output_max,
-            )
+            target_flow = max(output_min, min(output_max, target_flow))
 
         if flow_temp is not None:
             flow_error = target_flow - flow_temp
-            flow_trim = _clamp(flow_error * FLOW_KP, -FLOW_TRIM_MAX, FLOW_TRIM_MAX)
-            self._logger.debug(
-                "Flow feedback: measured=%.2f target=%.2f error=%.2f trim=%.2f",
-                flow_temp,
-                target_flow,
-                flow_error,
-                flow_trim,
-            )
-            target_flow = _clamp(
-                target_flow + flow_trim,
-                self._config.output_min,
-                self._config.output_max,
-            )
-
-        self._logger.debug(
-            "Update complete: target_flow=%.2f aggressiveness=%.3f combined_demand=%.3f",
-            target_flow,
-            aggressiveness,
-            combined_demand,
-        )
-        self._schedule_save_runtime()
+            flow_trim = max(-FLOW_TRIM_MAX, min(FLOW_TRIM_MAX, flow_error * FLOW_KP))
+            if self._debug:
+                self._logger.debug(
+                    "Flow feedback: measured=%.2f target=%.2f error=%.2f trim=%.2f",
+                    flow_temp,
+                    target_flow,
+                    flow_error,
+                    flow_trim,
+                )
+            target_flow = max(output_min, min(output_max, target_flow + flow_trim))
 
-        return ControllerState(
-            target_flow_c=target_flow,
-            combined_demand=combined_demand,
-            aggressiveness=aggressiveness,
-            weather_target_c=weather_target,
-            zone_diagnostics=zone_diagnostics,
-            flow_sensor_value=flow_temp,
-            outdoor_temperature=outdoor_temp,
-        )
+        return weather_target, target_flow
 
     def _read_numeric_entity(self, entity_id: str | None) -> float | None:
         if not entity_id:
             return None
-        state_obj = self.hass.states.get(entity_id)
+        return self._numeric_state(entity_id, self.hass.states.get(entity_id))
+
+    def _numeric_state(self, entity_id: str, state_obj: State | None) -> float | None:
         if state_obj is None:
-            self._logger.debug("Entity %s not found", entity_id)
+            if self._debug:
+                self._logger.debug("Entity %s not found", entity_id)
             return None
         if state_obj.state in {"unknown", "unavailable", "None"}:
-            self._logger.debug(
-                "Entity %s state %s treated as unavailable", entity_id, state_obj.state
-            )
+            if self._debug:
+                self._logger.debug(
+                    "Entity %s state %s treated as unavailable", entity_id, state_obj.state
+                )
             return None
         value = _safe_float(state_obj.state)
         if value is not None:
-            self._logger.debug("Entity %s state=%s", entity_id, value)
+            if self._debug:
+                self._logger.debug("Entity %s state=%s", entity_id, value)
             return value
         for key in ("temperature", "current_temperature", "value"):
             attr_val = state_obj.attributes.get(key)
             value = _safe_float(attr_val)
             if value is not None:
-                self._logger.debug("Entity %s attribute %s=%s", entity_id, key, value)
+                if self._debug:
+                    self._logger.debug("Entity %s attribute %s=%s", entity_id, key, value)
                 return value
-        self._logger.debug(
-            "Entity %s has no numeric value (state=%s attributes=%s)",
-            entity_id,
-            state_obj.state,
-            state_obj.attributes,
-        )
+        if self._debug:
+            self._logger.debug(
+                "Entity %s has no numeric value (state=%s attributes=%s)",
+                entity_id,
+                state_obj.state,
+                state_obj.attributes,
+            )
         return None
 
     async def async_load_runtime(self) -> None:
@@ -391,43 +492,57 @@ class ModulatingThermostatCoordinator(DataUpdateCoordinator[ControllerState]):
             return
         zones = cast(dict[str, Any], data.get("zones", {}))
         for zone_id, zone_state in zones.items():
-            runtime = self._zone_runtime.get(zone_id)
-            if runtime is None:
+            index = self._zone_index.get(zone_id)
+            if index is None:
                 continue
             zone_dict = cast(dict[str, Any], zone_state)
-            runtime.integral = float(zone_dict.get("integral", 0.0))
-            self._logger.debug("Restored zone %s integral to %.6f", zone_id, runtime.integral)
+            integral = float(zone_dict.get("integral", 0.0))
+            self._integrals[index] = integral
+            self._logger.debug("Restored zone %s integral to %.6f", zone_id, integral)
 
     async def async_unload(self) -> None:
-        """Cancel any pending persistence task during coordinator teardown."""
-        if self._save_task:
-            self._save_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await self._save_task
-        self._save_task = None
+        """Flush integrals still waiting on a delayed save during teardown."""
+        if self._store is None or not self._save_pending:
+            return
+        try:
+            await self._store.async_save(self._runtime_payload())
+        except Exception as err:  # pragma: no cover - defensive
+            self._logger.warning("Unable to persist runtime state: %s", err)
 
     def _schedule_save_runtime(self) -> None:
-        """Schedule a save of the current integrals once the event loop is idle."""
-        if self._store is None:
-            return
-        if self._save_task and not self._save_task.done():
-            return
-        self._save_task = self.hass.async_create_task(self._async_save_runtime())
+        """Queue a delayed save of the current integrals.
 
-    async def _async_save_runtime(self) -> None:
-        """Persist the integrals for each zone to Home Assistant storage."""
-        if self._store is None:
+        The store writes once per SAVE_DELAY at most, and flushes on Home
+        Assistant shutdown, so updates never spawn their own save tasks.
+        """
+        if self._store is None or self._save_pending:
             return
-        payload: dict[str, Any] = {
+        if self._integral_snapshot() == self._last_saved_integrals:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._runtime_payload, SAVE_DELAY)
+
+    def _integral_snapshot(self) -> tuple[float, ...]:
+        """Integrals at storage precision, used to skip no-op writes."""
+        return tuple(round(integral, 6) for integral in self._integrals)
+
+    def _runtime_payload(self) -> dict[str, Any]:
+        """Build the stored integrals; called by the store at write time.
+
+        The snapshot is recorded as saved here, before the write finishes,
+        because Store gives no later signal: it logs failed writes instead
+        of raising them. After a failed write the next change to any
+        integral queues another save.
+        """
+        integrals = tuple(self._integrals)
+        self._save_pending = False
+        self._last_saved_integrals = tuple(round(value, 6) for value in integrals)
+        return {
             "zones": {
-                zone_id: {"integral": runtime.integral}
-                for zone_id, runtime in self._zone_runtime.items()
+                zone.zone_id: {"integral": integral}
+                for zone, integral in zip(self._config.zones, integrals)
             }
         }
-        try:
-            await self._store.async_save(payload)
-        except Exception as err:  # pragma: no cover - defensive
-            self._logger.warning("Unable to persist runtime state: %s", err)
 
 
 def merge_entry_data(entry: Any) -> dict[str, Any]:
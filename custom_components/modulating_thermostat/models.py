@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any
 
 from .const import (
@@ -17,7 +17,7 @@ from .const import (
 )
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ZoneConfig:
     zone_id: str
     name: str
@@ -30,12 +30,6 @@ class ZoneConfig:
     deadband: float
 
 
-@dataclass(slots=True)
-class ZoneRuntime:
-    integral: float = 0.0
-    available: bool = False
-
-
 @dataclass(slots=True)
 class ZoneDiagnostics:
     temperature: float | None = None
@@ -46,12 +40,28 @@ class ZoneDiagnostics:
     weight_factor: float | None = None
     actuator_target: float | None = None
 
-
-def _zone_list_factory() -> list[ZoneConfig]:
-    return []
-
-
-@dataclass(slots=True)
+    def reset(self, temperature: float | None, target: float | None) -> None:
+        self.temperature = temperature
+        self.target = target
+        self.error = None
+        self.demand = None
+        self.actuator_ratio = None
+        self.weight_factor = None
+        self.actuator_target = None
+
+    def as_tuple(self) -> tuple[float | None, ...]:
+        return (
+            self.temperature,
+            self.target,
+            self.error,
+            self.demand,
+            self.actuator_ratio,
+            self.weight_factor,
+            self.actuator_target,
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class ControllerConfig:
     name: str
     outdoor_entity: str
@@ -67,7 +77,7 @@ class ControllerConfig:
     weather_slope_boost: float
     weather_offset: float
     log_level: str | None = None
-    zones: list[ZoneConfig] = field(default_factory=_zone_list_factory)
+    zones: tuple[ZoneConfig, ...] = ()
 
 
 @dataclass(slots=True)
@@ -76,62 +86,54 @@ class ControllerState:
     combined_demand: float
     aggressiveness: float
     weather_target_c: float
-    zone_diagnostics: dict[str, ZoneDiagnostics]
+    # Indexed like ControllerConfig.zones.
+    zone_diagnostics: list[ZoneDiagnostics]
     flow_sensor_value: float | None
     outdoor_temperature: float | None
 
 
+def _optional_float(value: Any) -> float | None:
+    return float(value) if value is not None else None
+
+
 def zone_from_dict(data: dict[str, Any]) -> ZoneConfig:
+    zone_id = data["zone_id"]
     return ZoneConfig(
-        zone_id=data["zone_id"],
-        name=data.get("name", data["zone_id"]),
+        zone_id=zone_id,
+        name=data.get("name", zone_id),
         weight=float(data["weight"]),
         temperature_entity=data["temperature_entity"],
         setpoint_entity=data["setpoint_entity"],
         actuator_entity=data.get("actuator_entity"),
-        actuator_min=(
-            float(data["actuator_min"])
-            if data.get("actuator_min") is not None
-            else None
-        ),
-        actuator_max=(
-            float(data["actuator_max"])
-            if data.get("actuator_max") is not None
-            else None
-        ),
+        actuator_min=_optional_float(data.get("actuator_min")),
+        actuator_max=_optional_float(data.get("actuator_max")),
         deadband=float(data.get("deadband", DEFAULT_DEADBAND)),
     )
 
 
 def controller_config_from_entry(data: dict[str, Any]) -> ControllerConfig:
-    raw_zones = data.get("zones", [])
-    zones = [zone_from_dict(zone) for zone in raw_zones]
+    get = data.get
+    log_level = get("log_level")
     return ControllerConfig(
         name=data["name"],
         outdoor_entity=data["outdoor_entity"],
-        flow_sensor_entity=data.get("flow_sensor_entity"),
-        aggressiveness_entity=data.get("aggressiveness_entity"),
+        flow_sensor_entity=get("flow_sensor_entity"),
+        aggressiveness_entity=get("aggressiveness_entity"),
         default_aggressiveness=float(
-            data.get("default_aggressiveness", DEFAULT_DEFAULT_AGGRESSIVENESS)
+            get("default_aggressiveness", DEFAULT_DEFAULT_AGGRESSIVENESS)
         ),
-        output_min=float(data.get("output_min", DEFAULT_OUTPUT_MIN)),
-        output_max=float(data.get("output_max", DEFAULT_OUTPUT_MAX)),
-        active_min_flow=float(data.get("active_min_flow", DEFAULT_ACTIVE_MIN_FLOW)),
-        update_interval=float(data.get("update_interval", DEFAULT_UPDATE_INTERVAL)),
+        output_min=float(get("output_min", DEFAULT_OUTPUT_MIN)),
+        output_max=float(get("output_max", DEFAULT_OUTPUT_MAX)),
+        active_min_flow=float(get("active_min_flow", DEFAULT_ACTIVE_MIN_FLOW)),
+        update_interval=float(get("update_interval", DEFAULT_UPDATE_INTERVAL)),
         weather_reference_temperature=float(
-            data.get("weather_reference_temperature", DEFAULT_WEATHER_REF)
-        ),
-        weather_slope_eco=float(
-            data.get("weather_slope_eco", DEFAULT_WEATHER_SLOPE_ECO)
+            get("weather_reference_temperature", DEFAULT_WEATHER_REF)
         ),
+        weather_slope_eco=float(get("weather_slope_eco", DEFAULT_WEATHER_SLOPE_ECO)),
         weather_slope_boost=float(
-            data.get("weather_slope_boost", DEFAULT_WEATHER_SLOPE_BOOST)
-        ),
-        weather_offset=float(data.get("weather_offset", DEFAULT_WEATHER_OFFSET)),
-        log_level=(
-            str(data.get("log_level")).lower()
-            if data.get("log_level") is not None
-            else None
+            get("weather_slope_boost", DEFAULT_WEATHER_SLOPE_BOOST)
         ),
-        zones=zones,
+        weather_offset=float(get("weather_offset", DEFAULT_WEATHER_OFFSET)),
+        log_level=str(log_level).lower() if log_level is not None else None,
+        zones=tuple(zone_from_dict(zone) for zone in get("zones", [])),
     )
@@ -20,6 +20,17 @@ from .const import DOMAIN
 from .coordinator import ModulatingThermostatCoordinator
 from .models import ControllerState, ZoneConfig
 
+# Matches the field order of ZoneDiagnostics.as_tuple().
+_ZONE_ATTR_KEYS = (
+    "temperature",
+    "target",
+    "error",
+    "demand",
+    "actuator_ratio",
+    "weight_factor",
+    "actuator_target",
+)
+
 
 class TargetFlowSensor(
     CoordinatorEntity[ModulatingThermostatCoordinator], SensorEntity
@@ -32,8 +43,7 @@ class TargetFlowSensor(
 
     def __init__(self, coordinator: ModulatingThermostatCoordinator) -> None:
         super().__init__(coordinator)
-        slug = slugify(coordinator.config.name)
-        self._attr_unique_id = f"{slug}_target_flow"
+        self._attr_unique_id = f"{coordinator.name_slug}_target_flow"
         self._attr_native_value = None
         self._attr_extra_state_attributes: dict[str, Any] = {}
 
@@ -45,16 +55,10 @@ class TargetFlowSensor(
         else:
             self._attr_native_value = round(data.target_flow_c, 2)
             zone_attrs = {
-                zone_id: {
-                    "temperature": info.temperature,
-                    "target": info.target,
-                    "error": info.error,
-                    "demand": info.demand,
-                    "actuator_ratio": info.actuator_ratio,
-                    "weight_factor": info.weight_factor,
-                    "actuator_target": info.actuator_target,
-                }
-                for zone_id, info in data.zone_diagnostics.items()
+                zone.zone_id: dict(zip(_ZONE_ATTR_KEYS, info.as_tuple()))
+                for zone, info in zip(
+                    self.coordinator.config.zones, data.zone_diagnostics
+                )
             }
             self._attr_extra_state_attributes = {
                 "combined_demand": round(data.combined_demand, 3),
@@ -92,6 +96,11 @@ class ZoneActuatorTargetSensor(
     ) -> None:
         super().__init__(coordinator)
         self._zone: ZoneConfig = zone
+        self._zone_idx = next(
+            index
+            for index, candidate in enumerate(coordinator.config.zones)
+            if candidate.zone_id == zone.zone_id
+        )
         slug = slugify(f"{coordinator.config.name}_{zone.zone_id}")
         self._attr_unique_id = f"{slug}_actuator_target"
         self._attr_name = f"{zone.name} actuator target"
@@ -107,8 +116,8 @@ class ZoneActuatorTargetSensor(
         data = cast(ControllerState | None, self.coordinator.data)
         if data is None:
             return None
-        zone_diag = data.zone_diagnostics.get(self._zone.zone_id)
-        if zone_diag is None or zone_diag.actuator_target is None:
+        zone_diag = data.zone_diagnostics[self._zone_idx]
+        if zone_diag.actuator_target is None:
             return None
         value = zone_diag.actuator_target
         return round(value, 3)
@@ -118,9 +127,7 @@ class ZoneActuatorTargetSensor(
         data = cast(ControllerState | None, self.coordinator.data)
         if data is None:
             return {}
-        zone_diag = data.zone_diagnostics.get(self._zone.zone_id)
-        if zone_diag is None:
-            return {}
+        zone_diag = data.zone_diagnostics[self._zone_idx]
         return {
             "demand": zone_diag.demand,
             "actuator_ratio": zone_diag.actuator_ratio,
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+import voluptuous as vol
+from homeassistant import config_entries
+from homeassistant.config_entries import ConfigEntry, ConfigFlowResult
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.modulating_thermostat.config_flow import (
+    ModulatingThermostatConfigFlow,
+    ModulatingThermostatOptionsFlow,
+)
+
+ZONE_INPUT: dict[str, Any] = {
+    "zone_id": "living",
+    "temperature_entity": "sensor.living_temp",
+    "setpoint_entity": "input_number.living_setpoint",
+}
+
+
+def _submit(result: ConfigFlowResult, user_input: dict[str, Any]) -> dict[str, Any]:
+    """Run user_input through the form's schema, as the frontend would."""
+    schema = result.get("data_schema")
+    assert isinstance(schema, vol.Schema)
+    return cast(dict[str, Any], schema(user_input))
+
+
+def _suggested(result: ConfigFlowResult, key: str) -> Any:
+    schema = result.get("data_schema")
+    assert isinstance(schema, vol.Schema)
+    (marker,) = (marker for marker in schema.schema if marker == key)
+    description = cast(dict[str, Any], marker.description or {})
+    return description.get("suggested_value")
+
+
+def _ignore_report(*args: Any, **kwargs: Any) -> None:
+    pass
+
+
+async def _zone_form(flow: ModulatingThermostatConfigFlow) -> ConfigFlowResult:
+    """Submit the user step with only its required fields; return the zone form."""
+    user_form = await flow.async_step_user()
+    result = await flow.async_step_user(
+        _submit(user_form, {"outdoor_entity": "sensor.outdoor"})
+    )
+    assert result.get("type") is FlowResultType.FORM
+    assert result.get("step_id") == "zone"
+    return result
+
+
+async def test_zone_step_rejects_zone_id_that_is_not_a_slug():
+    flow = ModulatingThermostatConfigFlow()
+    zone_form = await _zone_form(flow)
+
+    result = await flow.async_step_zone(
+        _submit(zone_form, {**ZONE_INPUT, "zone_id": "Living Room!"})
+    )
+
+    assert result.get("type") is FlowResultType.FORM
+    assert result.get("step_id") == "zone"
+    assert result.get("errors") == {"zone_id": "invalid_zone_id"}
+
+
+async def test_blank_optional_entities_are_left_out_of_the_entry():
+    flow = ModulatingThermostatConfigFlow()
+    zone_form = await _zone_form(flow)
+
+    result = await flow.async_step_zone(_submit(zone_form, ZONE_INPUT))
+
+    assert result.get("type") is FlowResultType.CREATE_ENTRY
+    data = result.get("data")
+    assert data is not None
+    assert "flow_sensor_entity" not in data
+    assert "aggressiveness_entity" not in data
+    (zone,) = data["zones"]
+    assert "actuator_entity" not in zone
+    assert "actuator_min" not in zone
+
+
+async def test_redrawn_zone_form_suggests_the_entered_entity():
+    flow = ModulatingThermostatConfigFlow()
+    zone_form = await _zone_form(flow)
+    assert _suggested(zone_form, "actuator_entity") is None
+
+    result = await flow.async_step_zone(
+        _submit(
+            zone_form,
+            {
+                **ZONE_INPUT,
+                "zone_id": "Living Room!",
+                "actuator_entity": "number.valve",
+            },
+        )
+    )
+
+    assert result.get("errors") == {"zone_id": "invalid_zone_id"}
+    assert _suggested(result, "actuator_entity") == "number.valve"
+
+
+async def test_options_form_shows_existing_values(monkeypatch: pytest.MonkeyPatch):
+    # Installed Home Assistant reports the explicit config_entry assignment
+    # through the frame helper, which is only set up inside a running hass.
+    monkeypatch.setattr(config_entries, "report_usage", _ignore_report)
+    entry = SimpleNamespace(
+        data={"name": "Boiler", "output_min": 30.0, "output_max": 70.0},
+        options={"output_max": 65.0},
+    )
+    flow = ModulatingThermostatOptionsFlow(cast(ConfigEntry, entry))
+
+    result = await flow.async_step_init()
+
+    assert _submit(result, {}) == {
+        "default_aggressiveness": 50.0,
+        "output_min": 30.0,
+        "output_max": 65.0,
+        "active_min_flow": 30.0,
+        "weather_slope_eco": 1.2,
+        "weather_slope_boost": 2.0,
+        "weather_offset": 20.0,
+    }
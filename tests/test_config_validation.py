@@ -0,0 +1,189 @@
+# pyright: reportPrivateUsage=none
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+import voluptuous as vol
+
+from custom_components.modulating_thermostat import _validate_controllers
+
+ZONE: dict[str, Any] = {
+    "zone_id": "living",
+    "temperature_entity": "sensor.living_temp",
+    "setpoint_entity": "input_number.living_setpoint",
+}
+
+CONTROLLER: dict[str, Any] = {
+    "name": "Boiler",
+    "outdoor_entity": "sensor.outdoor",
+    "zones": [ZONE],
+}
+
+
+def _without(data: dict[str, Any], key: str) -> dict[str, Any]:
+    return {k: v for k, v in data.items() if k != key}
+
+
+def test_defaults_are_filled_in():
+    (controller,) = _validate_controllers([CONTROLLER])
+
+    assert controller == {
+        "name": "Boiler",
+        "outdoor_entity": "sensor.outdoor",
+        "default_aggressiveness": 50.0,
+        "output_min": 25.0,
+        "output_max": 75.0,
+        "active_min_flow": 30.0,
+        "update_interval": 30,
+        "weather_reference_temperature": 21.0,
+        "weather_slope_eco": 1.2,
+        "weather_slope_boost": 2.0,
+        "weather_offset": 20.0,
+        "zones": [
+            {
+                "zone_id": "living",
+                "weight": 1.0,
+                "temperature_entity": "sensor.living_temp",
+                "setpoint_entity": "input_number.living_setpoint",
+                "actuator_min": 0.0,
+                "actuator_max": 100.0,
+                "deadband": 0.1,
+            }
+        ],
+    }
+
+
+def test_optional_keys_are_kept_and_coerced():
+    zone = {**ZONE, "name": "Living", "actuator_entity": "number.valve", "weight": "2"}
+    controller = {
+        **CONTROLLER,
+        "flow_sensor_entity": "sensor.flow",
+        "aggressiveness_entity": "input_number.aggressiveness",
+        "log_level": "debug",
+        "update_interval": "60",
+        "zones": [zone],
+    }
+
+    (result,) = _validate_controllers([controller])
+
+    assert result["flow_sensor_entity"] == "sensor.flow"
+    assert result["aggressiveness_entity"] == "input_number.aggressiveness"
+    assert result["log_level"] == "debug"
+    assert result["update_interval"] == 60
+    assert result["zones"][0]["name"] == "Living"
+    assert result["zones"][0]["actuator_entity"] == "number.valve"
+    assert result["zones"][0]["weight"] == 2.0
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param({"controllers": [CONTROLLER]}, id="controllers_key"),
+        pytest.param([{**CONTROLLER, "zones": ZONE}], id="single_zone_dict"),
+    ],
+)
+def test_non_list_values_are_wrapped(value: Any):
+    assert _validate_controllers(value) == _validate_controllers([CONTROLLER])
+
+
+@pytest.mark.parametrize(
+    "value, message, path",
+    [
+        pytest.param(
+            [{**CONTROLLER, "bogus": 1}],
+            "extra keys not allowed",
+            [0, "bogus"],
+            id="unknown_controller_key",
+        ),
+        pytest.param(
+            [{**CONTROLLER, "zones": [{**ZONE, "bogus": 1}]}],
+            "extra keys not allowed",
+            [0, "zones", 0, "bogus"],
+            id="unknown_zone_key",
+        ),
+        pytest.param(
+            [{**CONTROLLER, "default_aggressiveness": 150}],
+            "value must be at most 100",
+            [0, "default_aggressiveness"],
+            id="aggressiveness_above_range",
+        ),
+        pytest.param(
+            [{**CONTROLLER, "default_aggressiveness": -1}],
+            "value must be at least 0",
+            [0, "default_aggressiveness"],
+            id="aggressiveness_below_range",
+        ),
+        pytest.param(
+            [{**CONTROLLER, "update_interval": 5}],
+            "value must be at least 10",
+            [0, "update_interval"],
+            id="update_interval_below_range",
+        ),
+        pytest.param(
+            [{**CONTROLLER, "update_interval": "fast"}],
+            "expected int",
+            [0, "update_interval"],
+            id="update_interval_not_a_number",
+        ),
+        pytest.param(
+            [CONTROLLER, {**CONTROLLER, "zones": [ZONE, {**ZONE, "deadband": 3}]}],
+            "value must be at most 2.0",
+            [1, "zones", 1, "deadband"],
+            id="deadband_above_range",
+        ),
+        pytest.param(
+            [{**CONTROLLER, "zones": [{**ZONE, "weight": "heavy"}]}],
+            "expected float",
+            [0, "zones", 0, "weight"],
+            id="weight_not_a_number",
+        ),
+        pytest.param(
+            [_without(CONTROLLER, "zones")],
+            "required key not provided",
+            [0, "zones"],
+            id="missing_zones",
+        ),
+        pytest.param(
+            [{**CONTROLLER, "zones": [_without(ZONE, "setpoint_entity")]}],
+            "required key not provided",
+            [0, "zones", 0, "setpoint_entity"],
+            id="missing_setpoint",
+        ),
+        pytest.param(
+            [{**CONTROLLER, "outdoor_entity": "outdoor"}],
+            "Entity ID outdoor is an invalid entity ID",
+            [0, "outdoor_entity"],
+            id="invalid_entity_id",
+        ),
+        pytest.param(
+            [{**CONTROLLER, "zones": [{**ZONE, "zone_id": "Living Room"}]}],
+            "invalid slug Living Room (try living_room)",
+            [0, "zones", 0, "zone_id"],
+            id="invalid_zone_slug",
+        ),
+        pytest.param(
+            [{**CONTROLLER, "zones": "living"}],
+            "expected a dictionary",
+            [0, "zones", 0],
+            id="zones_not_a_list",
+        ),
+        pytest.param(
+            "boiler", "expected a dictionary", [0], id="controllers_not_a_list"
+        ),
+        pytest.param(
+            CONTROLLER,
+            "missing 'controllers' key",
+            [],
+            id="dict_without_controllers_key",
+        ),
+    ],
+)
+def test_invalid_config_reports_message_and_path(
+    value: Any, message: str, path: list[Any]
+):
+    with pytest.raises(vol.Invalid) as excinfo:
+        _validate_controllers(value)
+
+    assert excinfo.value.msg == message
+    assert excinfo.value.path == path
@@ -1,382 +1,345 @@
 # pyright: reportPrivateUsage=none
 from __future__ import annotations
 
-import asyncio
 import logging
-import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from decimal import Decimal
+from itertools import count
 from math import isclose
-from typing import Any, Coroutine, Tuple, cast
+from typing import Any
 
 import pytest
-from homeassistant.core import State
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from custom_components.modulating_thermostat.coordinator import (
     ModulatingThermostatCoordinator,
+    _combine_demand,
+    _pi_step,
+    _safe_float,
     merge_entry_data,
 )
 from custom_components.modulating_thermostat.models import (
     ControllerState,
-    ZoneRuntime,
     controller_config_from_entry,
 )
 
+_STAMPS = count()
+
+
+def _next_stamp() -> float:
+    return float(next(_STAMPS))
+
+
+@dataclass(slots=True, frozen=True)
+class _State:
+    """The subset of homeassistant.core.State the coordinator reads."""
+
+    entity_id: str
+    state: str
+    attributes: Mapping[str, Any] = field(default_factory=dict[str, Any])
+    last_updated_timestamp: float = field(default_factory=_next_stamp)
+
+
+LIVING_ZONE: dict[str, Any] = {
+    "name": "Living",
+    "zone_id": "living",
+    "weight": 1.0,
+    "temperature_entity": "sensor.living_temp",
+    "setpoint_entity": "input_number.living_setpoint",
+    "deadband": 0.1,
+}
+
+BEDROOM_ZONE: dict[str, Any] = {
+    "name": "Bedroom",
+    "zone_id": "bedroom",
+    "weight": 1.0,
+    "temperature_entity": "sensor.bedroom_temp",
+    "setpoint_entity": "input_number.bedroom_setpoint",
+    "deadband": 0.1,
+}
+
+BASE_ENTRY: dict[str, Any] = {
+    "name": "Boiler",
+    "outdoor_entity": "sensor.outdoor",
+    "default_aggressiveness": 50,
+    "output_min": 25.0,
+    "output_max": 75.0,
+    "active_min_flow": 30.0,
+    "update_interval": 30,
+    "weather_reference_temperature": 21.0,
+    "weather_slope_eco": 1.2,
+    "weather_slope_boost": 2.0,
+    "weather_offset": 20.0,
+    "zones": [LIVING_ZONE],
+}
+
+BASE_STATES: dict[str, _State] = {
+    "sensor.living_temp": _State("sensor.living_temp", "19.0"),
+    "input_number.living_setpoint": _State("input_number.living_setpoint", "21.0"),
+    "sensor.outdoor": _State("sensor.outdoor", "5.0"),
+}
+
 
 def assert_close(
     actual: float,
     expected: float,
     *,
-    rel: float | None = None,
-    abs_tol: float | None = None,
+    rel: float = 1e-9,
+    abs_tol: float = 0.0,
 ) -> None:
-    rel_tol = rel if rel is not None else 1e-9
-    abs_t = abs_tol if abs_tol is not None else 0.0
-    assert isclose(actual, expected, rel_tol=rel_tol, abs_tol=abs_t)
+    assert isclose(actual, expected, rel_tol=rel, abs_tol=abs_tol)
+
+
+_TEST_LOGGER = logging.getLogger("modulating_thermostat.test")
+_TEST_LOGGER.setLevel(logging.DEBUG)
+
+RunController = Callable[
+    [Mapping[str, Any], Mapping[str, _State]],
+    Awaitable[tuple[ModulatingThermostatCoordinator, ControllerState]],
+]
 
 
 class FakeHass:
-    def __init__(self, states: dict[str, State]) -> None:
-        self.states = states
+    def __init__(self) -> None:
+        self.states: dict[str, _State] = {}
 
-    def async_create_task(
-        self, coro: Coroutine[Any, Any, Any]
-    ) -> asyncio.Task[Any]:
-        return asyncio.create_task(coro)
 
+class DummyStore:
+    def __init__(self, payload: dict[str, Any] | None = None) -> None:
+        self._payload = payload
+        self.saved: dict[str, Any] | None = None
+        self.delayed: Callable[[], dict[str, Any]] | None = None
 
-async def run_controller(
-    entry_data: dict[str, Any],
-    states: dict[str, State],
-) -> Tuple[ModulatingThermostatCoordinator, ControllerState]:
-    config = controller_config_from_entry(entry_data)
-    coordinator = ModulatingThermostatCoordinator.__new__(
-        ModulatingThermostatCoordinator
-    )
-    coordinator.hass = cast(Any, FakeHass(states))
-    coordinator._logger = logging.getLogger("modulating_thermostat.test")
-    coordinator._logger.setLevel(logging.DEBUG)
-    coordinator._config = config
-    coordinator._zone_runtime = {zone.zone_id: ZoneRuntime() for zone in config.zones}
-    coordinator._last_monotonic = time.monotonic() - config.update_interval
-    coordinator._entry_id = "test"
-    coordinator._store = None
-    coordinator._save_task = None
-    result = await ModulatingThermostatCoordinator._async_update_data(coordinator)
-    return coordinator, result
-
-
-@pytest.mark.asyncio
-async def test_target_flow_rises_with_zone_demand():
-    entry: dict[str, Any] = {
-        "name": "Boiler",
-        "outdoor_entity": "sensor.outdoor",
-        "default_aggressiveness": 50,
-        "output_min": 25.0,
-        "output_max": 75.0,
-        "active_min_flow": 30.0,
-        "update_interval": 30,
-        "weather_reference_temperature": 21.0,
-        "weather_slope_eco": 1.2,
-        "weather_slope_boost": 2.0,
-        "weather_offset": 20.0,
-        "zones": [
-            {
-                "name": "Living",
-                "zone_id": "living",
-                "weight": 1.0,
-                "temperature_entity": "sensor.living_temp",
-                "setpoint_entity": "input_number.living_setpoint",
-                "deadband": 0.1,
-            }
-        ],
-    }
+    async def async_load(self) -> dict[str, Any] | None:
+        return self._payload
 
-    states: dict[str, State] = {
-        "sensor.living_temp": State("sensor.living_temp", "19.0"),
-        "input_number.living_setpoint": State("input_number.living_setpoint", "21.0"),
-        "sensor.outdoor": State("sensor.outdoor", "5.0"),
-    }
+    async def async_save(self, data: dict[str, Any]) -> None:
+        self.saved = data
 
-    _, result = await run_controller(entry, states)
-
-    assert_close(result.combined_demand, 1.0, abs_tol=1e-3)
-    assert_close(result.target_flow_c, 75.0, abs_tol=1e-6)
-
-
-@pytest.mark.asyncio
-async def test_zero_demand_holds_minimum_flow():
-    entry: dict[str, Any] = {
-        "name": "Boiler",
-        "outdoor_entity": "sensor.outdoor",
-        "default_aggressiveness": 50,
-        "output_min": 25.0,
-        "output_max": 75.0,
-        "active_min_flow": 30.0,
-        "update_interval": 30,
-        "weather_reference_temperature": 21.0,
-        "weather_slope_eco": 1.2,
-        "weather_slope_boost": 2.0,
-        "weather_offset": 20.0,
-        "zones": [
-            {
-                "name": "Living",
-                "zone_id": "living",
-                "weight": 1.0,
-                "temperature_entity": "sensor.living_temp",
-                "setpoint_entity": "input_number.living_setpoint",
-                "deadband": 0.1,
-            }
-        ],
-    }
+    def async_delay_save(
+        self, data_func: Callable[[], dict[str, Any]], delay: float
+    ) -> None:
+        self.delayed = data_func
 
-    states: dict[str, State] = {
-        "sensor.living_temp": State("sensor.living_temp", "21.6"),
-        "input_number.living_setpoint": State("input_number.living_setpoint", "21.0"),
-        "sensor.outdoor": State("sensor.outdoor", "5.0"),
-    }
 
-    _, result = await run_controller(entry, states)
-
-    assert result.combined_demand == 0.0
-    assert_close(result.target_flow_c, entry["output_min"], abs_tol=1e-6)
-
-
-@pytest.mark.asyncio
-async def test_flow_sensor_trim_adjusts_target():
-    entry: dict[str, Any] = {
-        "name": "Boiler",
-        "outdoor_entity": "sensor.outdoor",
-        "flow_sensor_entity": "sensor.flow",
-        "default_aggressiveness": 50,
-        "output_min": 25.0,
-        "output_max": 75.0,
-        "active_min_flow": 30.0,
-        "update_interval": 30,
-        "weather_reference_temperature": 21.0,
-        "weather_slope_eco": 1.2,
-        "weather_slope_boost": 2.0,
-        "weather_offset": 20.0,
-        "zones": [
-            {
-                "name": "Living",
-                "zone_id": "living",
-                "weight": 1.0,
-                "temperature_entity": "sensor.living_temp",
-                "setpoint_entity": "input_number.living_setpoint",
-                "deadband": 0.1,
-            }
-        ],
-    }
+@pytest.fixture
+def dummy_store() -> DummyStore:
+    return DummyStore()
 
-    states: dict[str, State] = {
-        "sensor.living_temp": State("sensor.living_temp", "19.0"),
-        "input_number.living_setpoint": State("input_number.living_setpoint", "21.0"),
-        "sensor.outdoor": State("sensor.outdoor", "5.0"),
-        "sensor.flow": State("sensor.flow", "40.0"),
-    }
 
-    _, result = await run_controller(entry, states)
-
-    assert_close(result.combined_demand, 1.0, abs_tol=1e-3)
-    assert_close(result.target_flow_c, 75.0, abs_tol=1e-6)
-
-
-@pytest.mark.asyncio
-async def test_deadband_zero_error():
-    entry: dict[str, Any] = {
-        "name": "Boiler",
-        "outdoor_entity": "sensor.outdoor",
-        "default_aggressiveness": 50,
-        "output_min": 25.0,
-        "output_max": 75.0,
-        "active_min_flow": 30.0,
-        "update_interval": 30,
-        "weather_reference_temperature": 21.0,
-        "weather_slope_eco": 1.2,
-        "weather_slope_boost": 2.0,
-        "weather_offset": 20.0,
-        "zones": [
-            {
-                "name": "Living",
-                "zone_id": "living",
-                "weight": 1.0,
-                "temperature_entity": "sensor.living_temp",
-                "setpoint_entity": "input_number.living_setpoint",
-                "deadband": 0.5,
-            }
-        ],
-    }
+class FakeClock:
+    """Stand-in for time.monotonic_ns that ticks 1 ns per read."""
 
-    states: dict[str, State] = {
-        "sensor.living_temp": State("sensor.living_temp", "20.6"),
-        "input_number.living_setpoint": State("input_number.living_setpoint", "20.8"),
-        "sensor.outdoor": State("sensor.outdoor", "5.0"),
-    }
+    def __init__(self) -> None:
+        self.now_ns = 0
 
-    _, result = await run_controller(entry, states)
-    diagnostics = result.zone_diagnostics["living"]
-
-    assert diagnostics.error == 0.0
-    assert result.combined_demand == 0.0
-
-
-@pytest.mark.asyncio
-async def test_actuator_missing_state_sets_none():
-    entry: dict[str, Any] = {
-        "name": "Boiler",
-        "outdoor_entity": "sensor.outdoor",
-        "default_aggressiveness": 50,
-        "output_min": 25.0,
-        "output_max": 75.0,
-        "active_min_flow": 30.0,
-        "update_interval": 30,
-        "weather_reference_temperature": 21.0,
-        "weather_slope_eco": 1.2,
-        "weather_slope_boost": 2.0,
-        "weather_offset": 20.0,
-        "zones": [
-            {
-                "name": "Living",
-                "zone_id": "living",
-                "weight": 1.0,
-                "temperature_entity": "sensor.living_temp",
-                "setpoint_entity": "input_number.living_setpoint",
-                "deadband": 0.1,
-                "actuator_entity": "number.living_valve",
-                "actuator_min": 0.0,
-                "actuator_max": 100.0,
-            }
-        ],
-    }
+    def __call__(self) -> int:
+        self.now_ns += 1
+        return self.now_ns
 
-    states: dict[str, State] = {
-        "sensor.living_temp": State("sensor.living_temp", "19.0"),
-        "input_number.living_setpoint": State("input_number.living_setpoint", "21.0"),
-        "sensor.outdoor": State("sensor.outdoor", "5.0"),
+    def ago(self, seconds: float) -> int:
+        """Return a reading taken ``seconds`` before the next tick."""
+        return self.now_ns + 1 - int(seconds * 1e9)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Make the coordinator's dt deterministic and skip the clock syscall."""
+    clock = FakeClock()
+    monkeypatch.setattr(
+        "custom_components.modulating_thermostat.coordinator.time.monotonic_ns",
+        clock,
+    )
+    return clock
+
+
+@pytest.fixture
+def fake_hass() -> FakeHass:
+    return FakeHass()
+
+
+@pytest.fixture
+def coordinator_factory(fake_hass: FakeHass, fake_clock: FakeClock) -> RunController:
+    """Run one update on a coordinator shell shared by the calling test."""
+    coordinator = ModulatingThermostatCoordinator.__new__(
+        ModulatingThermostatCoordinator
+    )
+    coordinator.hass = fake_hass  # type: ignore[assignment]
+    coordinator._logger = _TEST_LOGGER
+    coordinator._entry_id = "test"
+
+    async def run(
+        entry_data: Mapping[str, Any], states: Mapping[str, _State]
+    ) -> tuple[ModulatingThermostatCoordinator, ControllerState]:
+        config = controller_config_from_entry(dict(entry_data))
+        fake_hass.states.clear()
+        fake_hass.states.update(states)
+        coordinator._config = config
+        coordinator._init_zone_state()
+        coordinator._last_monotonic_ns = fake_clock.ago(config.update_interval)
+        coordinator._store = None
+        coordinator._save_pending = False
+        coordinator._last_saved_integrals = ()
+        result = await ModulatingThermostatCoordinator._async_update_data(coordinator)
+        return coordinator, result
+
+    return run
+
+
+SINGLE_ZONE_CASES = [
+    pytest.param({}, {}, 1.0, 75.0, (), id="demand_raises_flow"),
+    pytest.param(
+        {},
+        {"sensor.living_temp": _State("sensor.living_temp", "21.6")},
+        0.0,
+        25.0,
+        (),
+        id="zero_demand_holds_minimum",
+    ),
+    pytest.param(
+        {"flow_sensor_entity": "sensor.flow"},
+        {"sensor.flow": _State("sensor.flow", "40.0")},
+        1.0,
+        75.0,
+        (),
+        id="flow_sensor_trim",
+    ),
+    pytest.param(
+        {"zones": ({**LIVING_ZONE, "deadband": 0.5},)},
+        {
+            "sensor.living_temp": _State("sensor.living_temp", "20.6"),
+            "input_number.living_setpoint": _State(
+                "input_number.living_setpoint", "20.8"
+            ),
+        },
+        0.0,
+        25.0,
+        ((0, "error", 0.0),),
+        id="deadband_zero_error",
+    ),
+    pytest.param(
+        {
+            "zones": (
+                {
+                    **LIVING_ZONE,
+                    "actuator_entity": "number.living_valve",
+                    "actuator_min": 0.0,
+                    "actuator_max": 100.0,
+                },
+            )
+        },
+        {},
+        1.0,
+        75.0,
+        ((0, "actuator_ratio", None),),
+        id="actuator_missing_state",
+    ),
+    pytest.param(
+        {"zones": (LIVING_ZONE, BEDROOM_ZONE)},
+        {
+            "input_number.bedroom_setpoint": _State(
+                "input_number.bedroom_setpoint", "21.0"
+            )
+        },
+        1.0,
+        75.0,
+        ((1, "temperature", None),),
+        id="missing_sensor_skips_zone",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "entry_override, states_override, expected_demand, expected_flow, zone_checks",
+    SINGLE_ZONE_CASES,
+)
+async def test_single_zone_cases(
+    coordinator_factory: RunController,
+    entry_override: Mapping[str, Any],
+    states_override: Mapping[str, _State],
+    expected_demand: float,
+    expected_flow: float,
+    zone_checks: tuple[tuple[int, str, Any], ...],
+):
+    entry = {**BASE_ENTRY, **entry_override}
+    states = {**BASE_STATES, **states_override}
+
+    _, result = await coordinator_factory(entry, states)
+
+    if expected_demand == 0.0:
+        # Exact, because target flow only falls back to output_min at <= 0.
+        assert result.combined_demand == 0.0
+    else:
+        assert_close(result.combined_demand, expected_demand, abs_tol=1e-3)
+    assert_close(result.target_flow_c, expected_flow, abs_tol=1e-6)
+    assert len(result.zone_diagnostics) == len(entry["zones"])
+    for index, attribute, expected in zone_checks:
+        assert getattr(result.zone_diagnostics[index], attribute) == expected
+
+
+async def test_settled_update_reuses_state_until_inputs_change(
+    coordinator_factory: RunController, fake_hass: FakeHass
+):
+    states: dict[str, _State] = {
+        **BASE_STATES,
+        "sensor.living_temp": _State("sensor.living_temp", "21.05"),
     }
 
-    _, result = await run_controller(entry, states)
-    diagnostics = result.zone_diagnostics["living"]
+    coordinator, first = await coordinator_factory(BASE_ENTRY, states)
+    second = await ModulatingThermostatCoordinator._async_update_data(coordinator)
+    assert second is first
 
-    assert diagnostics.actuator_ratio is None
+    fake_hass.states["sensor.living_temp"] = _State("sensor.living_temp", "19.0")
+    third = await ModulatingThermostatCoordinator._async_update_data(coordinator)
+    assert third is not first
+    assert third.combined_demand > 0.0
 
 
-@pytest.mark.asyncio
-async def test_outdoor_missing_uses_reference_delta():
-    entry: dict[str, Any] = {
-        "name": "Boiler",
-        "outdoor_entity": "sensor.outdoor",
+async def test_outdoor_missing_uses_reference_delta(coordinator_factory: RunController):
+    entry = {
+        **BASE_ENTRY,
         "default_aggressiveness": 0,
-        "output_min": 25.0,
-        "output_max": 75.0,
-        "active_min_flow": 30.0,
-        "update_interval": 30,
-        "weather_reference_temperature": 21.0,
         "weather_slope_eco": 1.0,
         "weather_slope_boost": 1.0,
-        "weather_offset": 20.0,
-        "zones": [
-            {
-                "name": "Living",
-                "zone_id": "living",
-                "weight": 1.0,
-                "temperature_entity": "sensor.living_temp",
-                "setpoint_entity": "input_number.living_setpoint",
-                "deadband": 0.1,
-            }
-        ],
     }
 
-    states: dict[str, State] = {
-        "sensor.living_temp": State("sensor.living_temp", "19.0"),
-        "input_number.living_setpoint": State("input_number.living_setpoint", "21.0"),
+    states: dict[str, _State] = {
+        "sensor.living_temp": _State("sensor.living_temp", "19.0"),
+        "input_number.living_setpoint": _State("input_number.living_setpoint", "21.0"),
     }
 
-    _, result = await run_controller(entry, states)
+    _, result = await coordinator_factory(entry, states)
 
     assert result.outdoor_temperature is None
     assert_close(result.weather_target_c, 41.0, abs_tol=1e-6)
 
 
-@pytest.mark.asyncio
-async def test_read_numeric_entity_handles_invalid():
-    entry: dict[str, Any] = {
-        "name": "Boiler",
-        "outdoor_entity": "sensor.outdoor",
-        "default_aggressiveness": 50,
-        "output_min": 25.0,
-        "output_max": 75.0,
-        "active_min_flow": 30.0,
-        "update_interval": 30,
-        "weather_reference_temperature": 21.0,
-        "weather_slope_eco": 1.2,
-        "weather_slope_boost": 2.0,
-        "weather_offset": 20.0,
-        "zones": [
-            {
-                "name": "Living",
-                "zone_id": "living",
-                "weight": 1.0,
-                "temperature_entity": "sensor.living_temp",
-                "setpoint_entity": "input_number.living_setpoint",
-                "deadband": 0.1,
-            }
-        ],
+async def test_read_numeric_entity_handles_invalid(
+    coordinator_factory: RunController, fake_hass: FakeHass
+):
+    states: dict[str, _State] = {
+        **BASE_STATES,
+        "sensor.outdoor": _State("sensor.outdoor", "bad"),
     }
 
-    states: dict[str, State] = {
-        "sensor.living_temp": State("sensor.living_temp", "19.0"),
-        "input_number.living_setpoint": State("input_number.living_setpoint", "21.0"),
-        "sensor.outdoor": State("sensor.outdoor", "bad"),
-    }
+    coordinator, _ = await coordinator_factory(BASE_ENTRY, states)
+    fake_hass.states["sensor.outdoor"] = _State("sensor.outdoor", "unknown")
 
-    coordinator, _ = await run_controller(entry, states)
-    cast(Any, coordinator.hass).states["sensor.outdoor"] = State(
-        "sensor.outdoor", "unknown"
-    )
+    read = coordinator._read_numeric_entity
+    for entity_id in ("sensor.outdoor", "sensor.missing", None):
+        assert read(entity_id) is None, entity_id
 
-    assert coordinator._read_numeric_entity("sensor.outdoor") is None
-    assert coordinator._read_numeric_entity("sensor.missing") is None
-    assert coordinator._read_numeric_entity(None) is None
-
-
-@pytest.mark.asyncio
-async def test_update_fails_when_no_zones():
-    from homeassistant.helpers.update_coordinator import UpdateFailed
-
-    entry: dict[str, Any] = {
-        "name": "Boiler",
-        "outdoor_entity": "sensor.outdoor",
-        "default_aggressiveness": 50,
-        "output_min": 25.0,
-        "output_max": 75.0,
-        "active_min_flow": 30.0,
-        "update_interval": 30,
-        "weather_reference_temperature": 21.0,
-        "weather_slope_eco": 1.2,
-        "weather_slope_boost": 2.0,
-        "weather_offset": 20.0,
-        "zones": [],
-    }
 
-    states: dict[str, State] = {
-        "sensor.outdoor": State("sensor.outdoor", "5.0"),
-    }
+async def test_update_fails_when_no_zones(coordinator_factory: RunController):
+    entry: dict[str, Any] = {**BASE_ENTRY, "zones": []}
 
-    coordinator = ModulatingThermostatCoordinator.__new__(
-        ModulatingThermostatCoordinator
-    )
-    coordinator.hass = cast(Any, FakeHass(states))
-    coordinator._logger = logging.getLogger("modulating_thermostat.test")
-    coordinator._logger.setLevel(logging.DEBUG)
-    coordinator._config = controller_config_from_entry(entry)
-    coordinator._zone_runtime = {}
-    coordinator._last_monotonic = time.monotonic()
-    coordinator._entry_id = "test"
-    coordinator._store = None
-    coordinator._save_task = None
+    states: dict[str, _State] = {
+        "sensor.outdoor": _State("sensor.outdoor", "5.0"),
+    }
 
     with pytest.raises(UpdateFailed):
-        await ModulatingThermostatCoordinator._async_update_data(coordinator)
+        await coordinator_factory(entry, states)
 
 
 def test_merge_entry_data_prefers_options():
@@ -389,89 +352,98 @@ def test_merge_entry_data_prefers_options():
     assert merged["new"] == 1
 
 
-@pytest.mark.asyncio
-async def test_runtime_state_persistence():
-    entry: dict[str, Any] = {
-        "name": "Boiler",
-        "outdoor_entity": "sensor.outdoor",
-        "default_aggressiveness": 50,
-        "output_min": 25.0,
-        "output_max": 75.0,
-        "active_min_flow": 30.0,
-        "update_interval": 30,
-        "weather_reference_temperature": 21.0,
-        "weather_slope_eco": 1.2,
-        "weather_slope_boost": 2.0,
-        "weather_offset": 20.0,
-        "zones": [
-            {
-                "name": "Living",
-                "zone_id": "living",
-                "weight": 1.0,
-                "temperature_entity": "sensor.living_temp",
-                "setpoint_entity": "input_number.living_setpoint",
-                "deadband": 0.1,
-            }
-        ],
-    }
+def test_pi_step_integrates_error_and_decays_inside_deadband():
+    integral, output = _pi_step(2.0, 0.0, 30.0, 0.5, 0.001)
+    assert_close(integral, 60.0)
+    assert_close(output, 1.0)
 
-    states: dict[str, State] = {
-        "sensor.living_temp": State("sensor.living_temp", "19.0"),
-        "input_number.living_setpoint": State("input_number.living_setpoint", "21.0"),
-        "sensor.outdoor": State("sensor.outdoor", "5.0"),
-    }
+    integral, output = _pi_step(0.0, 10.0, 30.0, 0.5, 0.001)
+    assert_close(integral, 8.0)
+    assert_close(output, 0.008)
 
-    coordinator, _ = await run_controller(entry, states)
 
-    class DummyStore:
-        def __init__(self, payload: dict[str, Any] | None = None) -> None:
-            self._payload = payload
-            self.saved: dict[str, Any] | None = None
+def test_pi_step_clamps_integral_term():
+    integral, output = _pi_step(-5.0, -900.0, 30.0, 0.5, 0.001)
 
-        async def async_load(self) -> dict[str, Any] | None:
-            return self._payload
+    assert_close(integral, -1000.0)
+    assert output == 0.0
 
-        async def async_save(self, data: dict[str, Any]) -> None:
-            self.saved = data
 
-    coordinator._store = cast(
-        Any, DummyStore({"zones": {"living": {"integral": 2.5}}})
-    )
+def test_peak_demand_does_not_depend_on_zone_order():
+    weights = [0.5, 1.0]
+    outputs = [1.0, 0.0]
+
+    forward = _combine_demand(outputs, weights, 1.0)
+    reverse = _combine_demand(outputs[::-1], weights[::-1], 1.0)
+
+    assert forward == reverse
+    assert_close(forward[1], 0.5)
+
+
+class _Unreadable:
+    def __str__(self) -> str:
+        return "n/a"
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("21.5", 21.5),
+        (" 21.5 ", 21.5),
+        ("1e3", 1000.0),
+        ("unknown", None),
+        ("UNAVAILABLE", None),
+        ("none", None),
+        ("", None),
+        ("12,5", 12.5),
+        ("12 °C", 12.0),
+        ("temp: -4.2", -4.2),
+        ("abc", None),
+        (3, 3.0),
+        (2.5, 2.5),
+        (True, 1.0),
+        (None, None),
+        (Decimal("7.25"), 7.25),
+        (_Unreadable(), None),
+    ],
+)
+def test_safe_float_parses_states(value: Any, expected: float | None):
+    assert _safe_float(value) == expected
+
+
+async def test_runtime_state_persistence(
+    coordinator_factory: RunController, dummy_store: DummyStore
+):
+    states: Mapping[str, _State] = BASE_STATES
+
+    coordinator, _ = await coordinator_factory(BASE_ENTRY, states)
+
+    preloaded = DummyStore({"zones": {"living": {"integral": 2.5}}})
+    coordinator._store = preloaded  # type: ignore[assignment]
     await coordinator.async_load_runtime()
-    assert coordinator._zone_runtime["living"].integral == 2.5
+    assert coordinator._integrals[0] == 2.5
+
+    coordinator._store = dummy_store  # type: ignore[assignment]
+    coordinator._integrals[0] = 4.5
+    coordinator._schedule_save_runtime()
+    assert dummy_store.saved is None
+    await coordinator.async_unload()
+    assert dummy_store.saved is not None
+    assert dummy_store.saved["zones"]["living"]["integral"] == 4.5
 
-    save_store = DummyStore()
-    coordinator._store = cast(Any, save_store)
-    coordinator._zone_runtime["living"].integral = 4.5
+    dummy_store.delayed = None
     coordinator._schedule_save_runtime()
-    if coordinator._save_task:
-        await coordinator._save_task
-    assert save_store.saved is not None
-    assert save_store.saved["zones"]["living"]["integral"] == 4.5
-
-
-@pytest.mark.asyncio
-async def test_actuator_ratio_reflected_in_diagnostics():
-    entry: dict[str, Any] = {
-        "name": "Boiler",
-        "outdoor_entity": "sensor.outdoor",
-        "default_aggressiveness": 50,
-        "output_min": 25.0,
-        "output_max": 75.0,
-        "active_min_flow": 30.0,
-        "update_interval": 30,
-        "weather_reference_temperature": 21.0,
-        "weather_slope_eco": 1.2,
-        "weather_slope_boost": 2.0,
-        "weather_offset": 20.0,
+    assert dummy_store.delayed is None
+
+
+async def test_actuator_ratio_reflected_in_diagnostics(
+    coordinator_factory: RunController,
+):
+    entry = {
+        **BASE_ENTRY,
         "zones": [
             {
-                "name": "Living",
-                "zone_id": "living",
-                "weight": 1.0,
-                "temperature_entity": "sensor.living_temp",
-                "setpoint_entity": "input_number.living_setpoint",
-                "deadband": 0.1,
+                **LIVING_ZONE,
                 "actuator_entity": "number.living_valve",
                 "actuator_min": 10.0,
                 "actuator_max": 30.0,
@@ -479,121 +451,50 @@ async def test_actuator_ratio_reflected_in_diagnostics():
         ],
     }
 
-    states: dict[str, State] = {
-        "sensor.living_temp": State("sensor.living_temp", "19.5"),
-        "input_number.living_setpoint": State("input_number.living_setpoint", "21.0"),
-        "sensor.outdoor": State("sensor.outdoor", "5.0"),
-        "number.living_valve": State("number.living_valve", "20.0"),
+    states: dict[str, _State] = {
+        **BASE_STATES,
+        "sensor.living_temp": _State("sensor.living_temp", "19.5"),
+        "number.living_valve": _State("number.living_valve", "20.0"),
     }
 
-    _, result = await run_controller(entry, states)
+    _, result = await coordinator_factory(entry, states)
 
-    diagnostics = result.zone_diagnostics["living"]
+    diagnostics = result.zone_diagnostics[0]
     assert diagnostics.actuator_ratio is not None
     assert diagnostics.weight_factor is not None
     assert_close(diagnostics.actuator_ratio, 0.5, abs_tol=1e-3)
     assert_close(diagnostics.weight_factor, 0.5, abs_tol=1e-3)
 
 
-@pytest.mark.asyncio
-async def test_missing_sensor_skips_zone_without_crash():
-    entry: dict[str, Any] = {
-        "name": "Boiler",
-        "outdoor_entity": "sensor.outdoor",
-        "default_aggressiveness": 50,
-        "output_min": 25.0,
-        "output_max": 75.0,
-        "active_min_flow": 30.0,
-        "update_interval": 30,
-        "weather_reference_temperature": 21.0,
-        "weather_slope_eco": 1.2,
-        "weather_slope_boost": 2.0,
-        "weather_offset": 20.0,
-        "zones": [
-            {
-                "name": "Living",
-                "zone_id": "living",
-                "weight": 1.0,
-                "temperature_entity": "sensor.living_temp",
-                "setpoint_entity": "input_number.living_setpoint",
-                "deadband": 0.1,
-            },
-            {
-                "name": "Bedroom",
-                "zone_id": "bedroom",
-                "weight": 1.0,
-                "temperature_entity": "sensor.bedroom_temp",
-                "setpoint_entity": "input_number.bedroom_setpoint",
-                "deadband": 0.1,
-            },
-        ],
-    }
-
-    states: dict[str, State] = {
-        "sensor.living_temp": State("sensor.living_temp", "19.0"),
-        "input_number.living_setpoint": State("input_number.living_setpoint", "21.0"),
-        "input_number.bedroom_setpoint": State("input_number.bedroom_setpoint", "21.0"),
-        "sensor.outdoor": State("sensor.outdoor", "5.0"),
-    }
-
-    _, result = await run_controller(entry, states)
-
-    assert "bedroom" in result.zone_diagnostics
-    assert result.zone_diagnostics["bedroom"].temperature is None
-    assert_close(result.combined_demand, 1.0, abs_tol=1e-3)
-
-
-@pytest.mark.asyncio
-async def test_aggressiveness_biases_peak_demand():
+async def test_aggressiveness_biases_peak_demand(
+    coordinator_factory: RunController, fake_hass: FakeHass, fake_clock: FakeClock
+):
     base_entry = {
-        "name": "Boiler",
-        "outdoor_entity": "sensor.outdoor",
+        **BASE_ENTRY,
         "aggressiveness_entity": "input_number.aggressiveness",
         "default_aggressiveness": 10,
-        "output_min": 25.0,
-        "output_max": 75.0,
-        "active_min_flow": 30.0,
-        "update_interval": 30,
-        "weather_reference_temperature": 21.0,
-        "weather_slope_eco": 1.2,
-        "weather_slope_boost": 2.0,
-        "weather_offset": 20.0,
-        "zones": [
-            {
-                "name": "Living",
-                "zone_id": "living",
-                "weight": 2.0,
-                "temperature_entity": "sensor.living_temp",
-                "setpoint_entity": "input_number.living_setpoint",
-                "deadband": 0.1,
-            },
-            {
-                "name": "Bedroom",
-                "zone_id": "bedroom",
-                "weight": 1.0,
-                "temperature_entity": "sensor.bedroom_temp",
-                "setpoint_entity": "input_number.bedroom_setpoint",
-                "deadband": 0.1,
-            },
-        ],
+        "zones": [{**LIVING_ZONE, "weight": 2.0}, BEDROOM_ZONE],
     }
 
-    low_states: dict[str, State] = {
-        "sensor.living_temp": State("sensor.living_temp", "19.0"),
-        "input_number.living_setpoint": State("input_number.living_setpoint", "21.0"),
-        "sensor.bedroom_temp": State("sensor.bedroom_temp", "20.6"),
-        "input_number.bedroom_setpoint": State("input_number.bedroom_setpoint", "21.0"),
-        "sensor.outdoor": State("sensor.outdoor", "5.0"),
-        "input_number.aggressiveness": State("input_number.aggressiveness", "0"),
+    states: dict[str, _State] = {
+        **BASE_STATES,
+        "sensor.bedroom_temp": _State("sensor.bedroom_temp", "20.6"),
+        "input_number.bedroom_setpoint": _State(
+            "input_number.bedroom_setpoint", "21.0"
+        ),
+        "input_number.aggressiveness": _State("input_number.aggressiveness", "0"),
     }
 
-    high_states: dict[str, State] = dict(low_states)
-    high_states["input_number.aggressiveness"] = State(
+    coordinator, low_result = await coordinator_factory(base_entry, states)
+
+    # Rerun the same coordinator at full aggressiveness from a clean
+    # integrator, so only the demand blend differs between the two runs.
+    fake_hass.states["input_number.aggressiveness"] = _State(
         "input_number.aggressiveness", "100"
     )
-
-    _, low_result = await run_controller(base_entry, low_states)
-    _, high_result = await run_controller(base_entry, high_states)
+    coordinator._integrals[:] = [0.0, 0.0]
+    coordinator._last_monotonic_ns = fake_clock.ago(coordinator.config.update_interval)
+    high_result = await ModulatingThermostatCoordinator._async_update_data(coordinator)
 
     assert low_result.combined_demand < high_result.combined_demand
     assert_close(high_result.combined_demand, 1.0, abs_tol=1e-2)